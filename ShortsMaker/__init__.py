@@ -11,7 +11,7 @@ from .utils.audio_transcript import (
     align_transcript_with_script,
     generate_audio_transcription,
 )
-from .utils.colors_dict import COLORS_DICT
+from .utils.colors_dict import COLOR_NAMES, COLORS_ARRAY, COLORS_DICT, lookup_color
 from .utils.download_youtube_music import download_youtube_music, sanitize_filename
 from .utils.download_youtube_video import download_youtube_video
 from .utils.get_tts import VOICES, tts
@@ -31,7 +31,10 @@ __all__ = [
     download_youtube_music,
     download_youtube_video,
     abbreviation_replacer,
+    COLORS_ARRAY,
     COLORS_DICT,
+    COLOR_NAMES,
+    lookup_color,
     has_alpha_and_digit,
     split_alpha_and_digit,
     align_transcript_with_script,
@@ -4,6 +4,7 @@ import subprocess
 import time
 from pathlib import Path
 
+import httpx
 import ollama
 import psutil
 import yaml
@@ -44,10 +45,20 @@ class OllamaServiceManager:
         self.logger.name = "OllamaServiceManager"
         self.logger.info(f"Ollama service ollama_service_manager initialized on {self.system}")
 
-    def start_service(self) -> bool:
+    def start_service(self, timeout: float = 2.0) -> bool:
         """
         Starts the Ollama service.
 
+        Instead of sleeping for a fixed time, the server is probed with an exponential
+        backoff starting at 10ms, so the call returns as soon as it answers. Each probe is
+        bounded by the time left, so a server that accepts connections but never replies
+        cannot hold the call past `timeout`.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the server to answer. If it is still
+                starting up by then, the service counts as started as long as the process is
+                alive. Defaults to 2.0.
+
         Returns:
             bool: True if the service started successfully, False otherwise.
 
@@ -64,13 +75,28 @@ class OllamaServiceManager:
                 ollama_execution_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
             )
 
-            # Wait a moment for the service to start
-            time.sleep(2)
+            # Wait for the service to answer, or for the process to exit early
+            deadline = time.monotonic() + timeout
+            delay = 0.01
+            while self.process.poll() is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self.ollama.Client(timeout=remaining).ps()
+                    self.logger.info("Ollama service started successfully")
+                    return True
+                except (ConnectionError, httpx.HTTPError, ollama.ResponseError):
+                    pass
+                time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+                delay *= 2
 
             # Check if the service started successfully
             if self.process.poll() is None:
-                self.logger.info("Ollama service started successfully")
+                self.logger.warning("Ollama service is running but not answering yet")
                 return True
+            self.logger.error(f"Ollama service exited with code {self.process.returncode}")
+            return False
         except Exception as e:
             self.logger.error(f"Error starting Ollama service: {str(e)}")
             raise e
@@ -112,16 +138,17 @@ class OllamaServiceManager:
     @staticmethod
     def is_ollama_running():
         """
-        Checks if any Ollama process is currently running.
+        Checks if any Ollama process is currently running. Only process names are read,
+        and the scan stops at the first match.
 
         Returns:
             bool: True if an Ollama process is running, False otherwise.
         """
-        for proc in psutil.process_iter(["name", "cmdline"]):
+        for pid in psutil.pids():
             try:
-                if "ollama" in proc.info["name"].lower():
+                if "ollama" in psutil.Process(pid).name().lower():
                     return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
         return False
 
@@ -189,13 +216,11 @@ class OllamaServiceManager:
         Returns:
             list[str]: A list of the names of the downloaded models.
         """
-        model_list = []
         try:
-            model_list = list(self.ollama.list())  # list[tuple[model, list[models]]]
-            model_list = [i.model for i in model_list[0][1]]
+            return [model.model for model in self.ollama.list().models]
         except Exception as e:
             self.logger.error(f"Error getting list of downloaded files: {str(e)}")
-        return model_list
+        return []
 
 
 class AskLLM:
@@ -17,6 +17,7 @@ from moviepy import (
 )
 
 from .utils import (
+    COLOR_NAMES,
     COLORS_DICT,
     download_youtube_music,
     download_youtube_video,
@@ -280,7 +281,7 @@ class MoviepyCreateVideo:
         Raises:
             KeyError: If the dictionary is empty or an invalid key is accessed.
         """
-        return COLORS_DICT[random.choice(list(COLORS_DICT.keys()))]
+        return COLORS_DICT[random.choice(COLOR_NAMES)]
 
     def _load_transcript(self, transcript_path: Path | str) -> list[dict[str, Any]]:
         """
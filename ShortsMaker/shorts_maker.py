@@ -1,5 +1,7 @@
 import json
+import re
 import secrets
+import string
 from collections.abc import Generator
 from pathlib import Path
 from pprint import pformat
@@ -22,6 +24,17 @@ NOTIFY: bool = False
 # Constants
 PUNCTUATIONS = [".", ";", ":", "!", "?", '"']
 ESCAPE_CHARACTERS = ["\n", "\t", "\r", "  "]
+
+# Matches the (possibly empty) run of separators between a digit and a letter, or a
+# letter and a digit, so a space can be appended right before the next group starts.
+# Only valid for ASCII: the regex classes differ from str.isalpha / str.isdigit on
+# characters such as "²" or "½".
+_ALPHA_DIGIT_BOUNDARY = re.compile(r"(?<=\d)[\W_]*(?=[^\W\d_])|(?<=[^\W\d_])[\W_]*(?=\d)")
+
+# bytes.translate delete tables: everything except ASCII digits / ASCII letters
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if chr(b) not in string.digits)
+_NON_ALPHA_BYTES = bytes(b for b in range(256) if chr(b) not in string.ascii_letters)
+
 # abbreviation, replacement, padding
 ABBREVIATION_TUPLES = [
     ("\n", " ", ""),
@@ -68,6 +81,9 @@ def abbreviation_replacer(text: str, abbreviation: str, replacement: str, paddin
     Returns:
         str: The text with all occurrences of the abbreviation replaced by the replacement string.
     """
+    # Most abbreviations do not occur in a given post, skip both scans in that case.
+    if abbreviation not in text:
+        return text
     text = text.replace(abbreviation + padding, replacement)
     text = text.replace(padding + abbreviation, replacement)
     return text
@@ -78,7 +94,8 @@ def has_alpha_and_digit(word: str) -> bool:
     Determines if a string contains both alphabetic and numeric characters.
 
     This function checks whether the given string contains at least one alphabetic
-    character and at least one numeric character. It utilizes Python's string methods
+    character and at least one numeric character. ASCII input is checked with two
+    `bytes.translate` passes; anything else falls back to Python's string methods
     to identify the required character types.
 
     Args:
@@ -89,6 +106,12 @@ def has_alpha_and_digit(word: str) -> bool:
         bool: True if the string contains at least one alphabetic character and one
             numeric character, otherwise False.
     """
+    if word.isascii():
+        # Fast path: let bytes.translate strip everything but digits / letters in C.
+        raw = word.encode("ascii")
+        return bool(raw.translate(None, _NON_DIGIT_BYTES)) and bool(
+            raw.translate(None, _NON_ALPHA_BYTES)
+        )
     return any(character.isalpha() for character in word) and any(
         character.isdigit() for character in word
     )
@@ -102,7 +125,9 @@ def split_alpha_and_digit(word):
     distinct groups of alphabetic sequences and numeric sequences. A space is added
     between these groups whenever a transition occurs between alphabetic and numeric
     characters, or vice versa. Non-alphanumeric characters are included as is without
-    causing a split.
+    causing a split; the space is placed right before the character that starts the
+    new group. ASCII input is scanned by a single precompiled regex; anything else
+    falls back to a loop over Python's string methods.
 
     Args:
         word (str): The input string to be split into alphabetic and numeric
@@ -112,6 +137,8 @@ def split_alpha_and_digit(word):
         str: A string where alphabetic and numeric segments from the input are
             separated by a space while retaining other characters.
     """
+    if word.isascii():
+        return _ALPHA_DIGIT_BOUNDARY.sub(r"\g<0> ", word)
     res = ""
     alpha = False
     digit = False
@@ -542,6 +569,9 @@ class ShortsMaker:
         resulting transcript into a specified output file or a default cache location. Additionally,
         provides an option to enable debug logging.
 
+        The whisper and alignment models are unloaded afterwards to free GPU memory for the
+        following steps, set `cleanup: False` under `audio` to keep them cached between calls.
+
         Args:
             source_audio_file (Path): The source audio file to be transcribed.
             source_text_file (Path): The text file containing the corresponding script.
@@ -566,7 +596,8 @@ class ShortsMaker:
             device=self.audio_cfg["device"],
             model=self.audio_cfg["model"],
             batch_size=self.audio_cfg["batch_size"],
-            compute_type=self.audio_cfg["compute_type"],
+            compute_type=self.audio_cfg.get("compute_type"),
+            cleanup=self.audio_cfg.get("cleanup", True),
         )
         self.word_transcript = self._filter_word_transcript(self.word_transcript)
 
@@ -1,5 +1,5 @@
 from .audio_transcript import align_transcript_with_script, generate_audio_transcription
-from .colors_dict import COLORS_DICT
+from .colors_dict import COLOR_NAMES, COLORS_ARRAY, COLORS_DICT, lookup_color
 from .download_youtube_music import download_youtube_music, sanitize_filename
 from .download_youtube_video import download_youtube_video
 from .get_tts import VOICES, tts
@@ -14,11 +14,14 @@ __all__ = [
     download_youtube_video,
     generate_audio_transcription,
     get_logger,
+    lookup_color,
     notify_discord,
     retry,
     sanitize_filename,
     tts,
+    COLORS_ARRAY,
     COLORS_DICT,
+    COLOR_NAMES,
     VOICES,
 ]
 
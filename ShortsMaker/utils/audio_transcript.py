@@ -1,15 +1,29 @@
 import gc
+from functools import lru_cache
+from itertools import accumulate
 from pprint import pformat
 
 import torch
 import whisperx
-from rapidfuzz import process
+from rapidfuzz import fuzz, process
 
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=2)
+def _load_whisper_model(model: str, device: str, compute_type: str):
+    """Loads a whisper model once per (model, device, compute_type) and keeps it in memory."""
+    return whisperx.load_model(model, device, compute_type=compute_type)
+
+
+@lru_cache(maxsize=2)
+def _load_align_model(language_code: str, device: str):
+    """Loads an alignment model and its metadata once per (language_code, device)."""
+    return whisperx.load_align_model(language_code=language_code, device=device)
+
+
 def align_transcript_with_script(transcript: list[dict], script_string: str) -> list[dict]:
     """
     Aligns the transcript entries with corresponding segments of a script string by
@@ -38,29 +52,49 @@ def align_transcript_with_script(transcript: list[dict], script_string: str) ->
     window_sizes = [i for i in range(6)]
     script_words = script_string.split()
 
+    # Every candidate window is a prefix of the not yet consumed script words. Index
+    # where each word starts in the joined script once, so a window is a single
+    # string slice instead of a fresh join over the rest of the script.
+    script_text = " ".join(script_words)
+    word_starts = list(accumulate((len(word) + 1 for word in script_words), initial=0))
+    consumed = 0
+
     for entry in transcript:
-        possible_windows = []
+        remaining = len(script_words) - consumed
         length_of_entry_text = len(entry["text"].split())
 
-        # Generate script windows for all specified window sizes
+        # Generate script windows for all specified window sizes, as word counts
+        # resolved the way slicing the remaining words with [:end] would
+        window_ends = []
         for window_size in window_sizes:
-            possible_windows.extend([" ".join(script_words[: length_of_entry_text + window_size])])
-            possible_windows.extend([" ".join(script_words[: length_of_entry_text - window_size])])
+            for end in (length_of_entry_text + window_size, length_of_entry_text - window_size):
+                window_ends.append(min(end, remaining) if end >= 0 else max(remaining + end, 0))
+
+        start = word_starts[consumed]
+        possible_windows = [
+            script_text[start : word_starts[consumed + end] - 1] if end else ""
+            for end in window_ends
+        ]
 
         # Find the best match among all possible windows
         # print(f"Entry text: {entry['text']}\n"
         #       f"Possible windows: {possible_windows}"
         #       "\n\n\n"
         #       )
-        best_match, score, _ = process.extractOne(entry["text"], possible_windows)
+        # Each entry's windows depend on how much script the previous entry consumed, so
+        # the entries cannot be scored together in one process.cdist matrix. For a single
+        # row of a dozen windows extractOne is several times faster than cdist + argmax.
+        best_match, score, index = process.extractOne(
+            entry["text"], possible_windows, scorer=fuzz.WRatio
+        )
 
         if best_match:
-            script_words = script_words[len(best_match.split()) :]
+            consumed += window_ends[index]
 
         # print(
         #     f"Best match: {best_match}, Score: {score} "
-        #     f"Script words remaining: {len(script_words)}"
-        #     f"Script words: {script_words} \n\n"
+        #     f"Script words remaining: {len(script_words) - consumed}"
+        #     f"Script words: {script_words[consumed:]} \n\n"
         # )
 
         # Add the match or original text to the new transcript
@@ -79,8 +113,9 @@ def generate_audio_transcription(
     script: str,
     device="cuda",
     batch_size=16,
-    compute_type="float16",
+    compute_type: str | None = None,
     model="large-v2",
+    cleanup: bool = False,
 ) -> list[dict[str, str | float]]:
     """
     Generates a transcription of an audio file by performing speech-to-text transcription and aligning the
@@ -88,17 +123,21 @@ def generate_audio_transcription(
     accuracy.
 
     This function processes the audio in batches, aligns the transcriptions with the provided script for better
-    accuracy, and cleans GPU memory usage during its workflow. It outputs a list of word-level transcriptions
-    with start and end times for enhanced downstream processing.
+    accuracy, and outputs a list of word-level transcriptions with start and end times for enhanced downstream
+    processing. The whisper and alignment models are kept loaded between calls, so transcribing several files
+    only reads the weights once; pass `cleanup=True` to release them and free GPU memory afterwards.
 
     Args:
         audio_file (str): The path to the audio file that needs to be transcribed.
         script (str): The text script used for alignment with the transcribed segments.
         device (str): The device to be used for computation, default is 'cuda'.
         batch_size (int): The batch size to use during transcription, default is 16.
-        compute_type (str): The precision type to be used for the model, default is "float16".
+        compute_type (str | None): The precision type to be used for the model. Defaults to None,
+            which picks "float16" when running on an available CUDA device and "int8" otherwise.
         model (str): The Whisper model variant to use, default is "large-v2". Options include "medium",
             "large-v2", and "large-v3".
+        cleanup (bool): Whether to unload the cached models and free GPU memory once each model is done,
+            default is False.
 
     Returns:
         list[dict[str, str | float]]: A list of dictionaries, where each dictionary represents a word in
@@ -108,9 +147,13 @@ def generate_audio_transcription(
         Could include potential runtime or memory-related errors specific to the underlying
         libraries or resource management.
     """
+    if compute_type is None:
+        cuda = device.startswith("cuda") and torch.cuda.is_available()
+        compute_type = "float16" if cuda else "int8"
+
     # 1. Transcribe with original whisper (batched)
     # options for models medium, large-v2, large-v3
-    model = whisperx.load_model(model, device, compute_type=compute_type)
+    model = _load_whisper_model(model, device, compute_type)
 
     audio = whisperx.load_audio(audio_file)
     result = model.transcribe(audio, batch_size=batch_size, language="en")
@@ -119,13 +162,15 @@ def generate_audio_transcription(
     new_aligned_transcript = align_transcript_with_script(result["segments"], script)
 
     # delete model if low on GPU resources
-    gc.collect()
-    if torch.cuda.is_available():
-        torch.cuda.empty_cache()
-    del model
+    if cleanup:
+        _load_whisper_model.cache_clear()
+        del model
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
     # 2. Align whisper output
-    model_a, metadata = whisperx.load_align_model(language_code=result["language"], device=device)
+    model_a, metadata = _load_align_model(result["language"], device)
     result = whisperx.align(
         new_aligned_transcript,
         model_a,
@@ -156,9 +201,11 @@ def generate_audio_transcription(
 
     logger.debug(f"Transcript:\n {pformat(word_transcript)}")  # before alignment
 
-    gc.collect()
-    if torch.cuda.is_available():
-        torch.cuda.empty_cache()
-    del model_a
+    if cleanup:
+        _load_align_model.cache_clear()
+        del model_a, metadata
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
     return word_transcript
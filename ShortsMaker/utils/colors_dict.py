@@ -1,5 +1,9 @@
+from types import MappingProxyType
+
+import numpy as np
+
 # A list of colors and their equivalent RGBA values
-COLORS_DICT: dict[str, tuple[int, int, int, int]] = {
+_COLORS: dict[str, tuple[int, int, int, int]] = {
     "aquamarine": (127, 255, 212, 255),
     "aquamarine2": (118, 238, 198, 255),
     "azure1": (240, 255, 255, 255),
@@ -155,3 +159,28 @@ COLORS_DICT: dict[str, tuple[int, int, int, int]] = {
     "yellow": (255, 255, 0, 255),
     "yellow2": (238, 238, 0, 255),
 }
+
+# Read-only view so callers cannot mutate the shared palette
+COLORS_DICT: MappingProxyType[str, tuple[int, int, int, int]] = MappingProxyType(_COLORS)
+
+# The same palette as a read-only (N, 4) uint8 table, row i holds the RGBA of COLOR_NAMES[i]
+COLOR_NAMES: tuple[str, ...] = tuple(_COLORS)
+COLORS_ARRAY: np.ndarray = np.array(list(_COLORS.values()), dtype=np.uint8)
+COLORS_ARRAY.setflags(write=False)
+_COLOR_INDEX: dict[str, int] = {name: index for index, name in enumerate(COLOR_NAMES)}
+
+
+def lookup_color(name: str) -> np.ndarray:
+    """
+    Looks up the RGBA value of a named color.
+
+    Args:
+        name (str): The name of the color, one of COLOR_NAMES.
+
+    Returns:
+        np.ndarray: A read-only uint8 view of shape (4,) into COLORS_ARRAY.
+
+    Raises:
+        KeyError: If the color name is not in the palette.
+    """
+    return COLORS_ARRAY[_COLOR_INDEX[name]]
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 import yt_dlp
@@ -6,11 +7,16 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# spaces and characters that are invalid in filenames all become underscores
+_FILENAME_TRANSLATION = str.maketrans(dict.fromkeys(' <>:"/\\|?*', "_"))
 
+
+@lru_cache(maxsize=1024)
 def sanitize_filename(source_filename: str) -> str:
     """
     Sanitizes a given filename by removing leading and trailing spaces, replacing spaces with underscores,
-    and replacing invalid characters with underscores.
+    and replacing invalid characters with underscores. The replacements are done in a single
+    translate pass and results are cached, as titles tend to repeat across a playlist.
 
     Args:
         source_filename (str): The original filename to be sanitized.
@@ -18,13 +24,8 @@ def sanitize_filename(source_filename: str) -> str:
     Returns:
         str: The sanitized filename.
     """
-    sanitized_filename = source_filename
-    sanitized_filename = sanitized_filename.strip()
-    sanitized_filename = sanitized_filename.strip(" .")
-    sanitized_filename = sanitized_filename.replace(" ", "_")
-    invalid_chars = '<>:"/\\|?*'
-    sanitized_filename = "".join("_" if c in invalid_chars else c for c in sanitized_filename)
-    return sanitized_filename
+    sanitized_filename = source_filename.strip().strip(" .")
+    return sanitized_filename.translate(_FILENAME_TRANSLATION)
 
 
 def download_youtube_music(music_url: str, music_dir: Path, force: bool = False) -> list[Path]:
@@ -75,39 +76,61 @@ def download_youtube_music(music_url: str, music_dir: Path, force: bool = False)
                     logger.info("Full audio downloaded successfully!")
             return [output_path]
 
-        # Handle case with chapters
-        for chapter in info_dict["chapters"]:
-            logger.info(f"Found chapter: {chapter['title']}")
-            sanitized_filename = sanitize_filename(chapter["title"])
-
-            ydl_opts = {
-                "format": "bestaudio",
-                "outtmpl": str(music_dir / f"{sanitized_filename}.%(ext)s"),
-                "download_ranges": lambda chapter_range, *args: [
-                    {
-                        "start_time": chapter["start_time"],
-                        "end_time": chapter["end_time"],
-                        "title": chapter["title"],
-                    }
-                ],
-                "force_keyframes_at_cuts": True,
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "wav",
-                        "preferredquality": "0",
-                    }
-                ],
-                "restrictfilenames": True,
-            }
-
-            output_path = music_dir / f"{sanitized_filename}.wav"
-            logger.info(f"Output path: {output_path.absolute()}")
-            if (not output_path.exists() and not force) or force:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl_chapter_audio:
-                    ydl_chapter_audio.download([music_url])
-                    print(f"Chapter downloaded: {chapter['title']}")
+        # Handle case with chapters, one downloader is set up and reused for all of them
+        chapter_opts = {
+            "format": "bestaudio",
+            "force_keyframes_at_cuts": True,
+            "postprocessors": [
+                {
+                    "key": "FFmpegExtractAudio",
+                    "preferredcodec": "wav",
+                    "preferredquality": "0",
+                }
+            ],
+            "restrictfilenames": True,
+        }
+        with yt_dlp.YoutubeDL(chapter_opts) as ydl_chapter_audio:
+            for chapter in info_dict["chapters"]:
+                _download_chapter(ydl_chapter_audio, music_url, music_dir, chapter, force)
 
     # Return path to first music file found
     music_files = list(music_dir.glob("*.wav"))
     return music_files
+
+
+def _download_chapter(
+    ydl: yt_dlp.YoutubeDL, music_url: str, music_dir: Path, chapter: dict, force: bool
+) -> Path:
+    """
+    Downloads a single chapter of a YouTube video as a wav file. The shared downloader
+    only has its output template and download range pointed at the chapter, so its
+    options and post processors are not set up again for every chapter.
+
+    Args:
+        ydl (yt_dlp.YoutubeDL): The downloader shared by all chapters of the video.
+        music_url (str): The YouTube URL of the music video.
+        music_dir (Path): The directory where the chapter audio is saved.
+        chapter (dict): The chapter info with "title", "start_time" and "end_time".
+        force (bool): Specifies whether an existing file should be overwritten.
+
+    Returns:
+        Path: The path of the chapter audio file.
+    """
+    logger.info(f"Found chapter: {chapter['title']}")
+    sanitized_filename = sanitize_filename(chapter["title"])
+
+    output_path = music_dir / f"{sanitized_filename}.wav"
+    logger.info(f"Output path: {output_path.absolute()}")
+    if (not output_path.exists() and not force) or force:
+        # YoutubeDL normalizes outtmpl into a dict of templates when it is created
+        ydl.params["outtmpl"]["default"] = str(music_dir / f"{sanitized_filename}.%(ext)s")
+        ydl.params["download_ranges"] = lambda chapter_range, *args: [
+            {
+                "start_time": chapter["start_time"],
+                "end_time": chapter["end_time"],
+                "title": chapter["title"],
+            }
+        ]
+        ydl.download([music_url])
+        print(f"Chapter downloaded: {chapter['title']}")
+    return output_path
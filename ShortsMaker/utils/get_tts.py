@@ -1,17 +1,33 @@
 import base64
+import binascii
 import io
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pformat
-from threading import Thread
 
+import numpy as np
 import requests
 from pydub import AudioSegment
+from requests.adapters import HTTPAdapter
 
 from .logging_config import get_logger
 from .retry import retry
 
 logger = get_logger(__name__)
 
+# texts shorter than this are wrapped with textwrap, numpy's setup cost is not worth it
+SMALL_TEXT_LENGTH = 256
+
+# upper bound on concurrent chunk requests against a single endpoint
+MAX_WORKERS = 8
+
+# (connect, read) timeout in seconds, a stalled endpoint fails over to the next one
+REQUEST_TIMEOUT = (3.05, 30)
+
+# shared session so chunk requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 # define the endpoint data with URLs and corresponding response keys
 ENDPOINT_DATA = [
     {
@@ -34,6 +50,9 @@ VOICES = [
     "en_female_emotional",  # peaceful
 ]
 
+# set view of VOICES for constant time validation
+_VOICES_SET = frozenset(VOICES)
+
 
 # define the text-to-speech function
 @retry(max_retries=3, delay=5)
@@ -56,7 +75,7 @@ def tts(text: str, voice: str, output_filename: str = "output.mp3") -> None:
     global ENDPOINT_DATA
 
     for endpoint in ENDPOINT_DATA:
-        audio_data = [""] * len(chunks)
+        audio_data = [b""] * len(chunks)
         audio_data = _process_chunks(chunks, endpoint, voice, audio_data)
         if audio_data is not None:
             _save_audio(audio_data, output_filename)
@@ -64,7 +83,7 @@ def tts(text: str, voice: str, output_filename: str = "output.mp3") -> None:
 
 
 def _validate_inputs(text: str, voice: str) -> None:
-    if voice not in VOICES:
+    if voice not in _VOICES_SET:
         raise ValueError("voice must be valid")
     if not text:
         raise ValueError("text must not be 'None'")
@@ -78,8 +97,8 @@ def _log_chunks(text: str, chunks: list[str]) -> None:
 
 
 def _process_chunks(
-    chunks: list[str], endpoint: dict, voice: str, audio_data: list[str]
-) -> list[str] | None:
+    chunks: list[str], endpoint: dict, voice: str, audio_data: list[bytes]
+) -> list[bytes] | None:
     valid = True
 
     def generate_audio_chunk(index: int, chunk: str) -> None:
@@ -89,15 +108,17 @@ def _process_chunks(
 
         try:
             logger.info(f"Using endpoint: {endpoint['url']}")
-            response = requests.post(
+            response = _SESSION.post(
                 endpoint["url"],
                 json={"text": chunk, "voice": voice},
                 headers={
                     "User-Agent": "com.zhiliaoapp.musically/2022600030 (Linux; U; Android 7.1.2; es_ES; SM-G988N; Build/NRD90M;tt-ok/3.12.13.1)",
                 },
+                timeout=REQUEST_TIMEOUT,
             )
             if response.status_code == 200:
-                audio_data[index] = response.json()[endpoint["response"]]
+                # decode here, on the worker, so chunks are kept as raw audio bytes
+                audio_data[index] = base64.b64decode(response.json()[endpoint["response"]])
                 logger.info(
                     f"Chunk {index} processed successfully with endpoint: {endpoint['url']}"
                 )
@@ -110,28 +131,57 @@ def _process_chunks(
             logger.warning(f"JSONDecodeError for endpoint {endpoint['url']}: {e}")
             logger.error(f"RequestException for endpoint {endpoint['url']}: {e}")
             valid = False
+        except binascii.Error as e:
+            logger.warning(f"Invalid base64 audio from endpoint {endpoint['url']}: {e}")
+            valid = False
+        except (KeyError, TypeError) as e:
+            # a 200 whose body lacks the expected key, or is not a JSON object at all
+            logger.warning(f"Unexpected response body from endpoint {endpoint['url']}: {e!r}")
+            valid = False
         except requests.RequestException as e:
-            logger.warning(f"Response from endpoint {endpoint['url']}:\n{pformat(response.json)}")
+            # the request may have failed before any response was received
+            logger.warning(f"Response from endpoint {endpoint['url']}:\n{pformat(e.response)}")
             logger.error(f"RequestException for endpoint {endpoint['url']}: {e}")
             valid = False
 
-    threads = [
-        Thread(target=generate_audio_chunk, args=(i, chunk)) for i, chunk in enumerate(chunks)
-    ]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
+    # each worker writes into audio_data[index], so chunk order is preserved
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks) or 1)) as executor:
+        list(executor.map(generate_audio_chunk, range(len(chunks)), chunks))
 
     return audio_data if valid else None
 
 
-def _save_audio(audio_data: list[str], output_filename: str) -> None:
-    audio_bytes = b"".join(base64.b64decode(chunk) for chunk in audio_data)
+def _save_audio(audio_data: list[bytes], output_filename: str) -> None:
+    audio_bytes = b"".join(audio_data)
     audio_segment: AudioSegment = AudioSegment.from_file(io.BytesIO(audio_bytes))
     audio_segment.export(output_filename, format="wav")
 
 
+def _break_indices(word_ends: np.ndarray, chunk_size: int) -> list[int]:
+    """
+    Computes where to cut a list of words so that every chunk fits in chunk_size.
+
+    Args:
+        word_ends (np.ndarray): Cumulative lengths of the words, each counted with
+            one trailing space.
+        chunk_size (int): The maximum length of a chunk.
+
+    Returns:
+        list[int]: The exclusive end index of each chunk. A word longer than
+        chunk_size gets a chunk of its own.
+    """
+    breaks = []
+    start = 0
+    total = len(word_ends)
+    while start < total:
+        base = word_ends[start - 1] if start else 0
+        # the trailing space of the last word in a chunk is not part of the chunk
+        end = int(np.searchsorted(word_ends, base + chunk_size + 1, side="right"))
+        start = max(end, start + 1)
+        breaks.append(start)
+    return breaks
+
+
 def _split_text(text: str, chunk_size: int = 250) -> list[str]:
     """
     Splits a given text into smaller chunks of a specified size without breaking
@@ -139,7 +189,8 @@ def _split_text(text: str, chunk_size: int = 250) -> list[str]:
 
     The function wraps the input text into smaller substrings, ensuring the
     integrity of the text by preventing cutoff mid-word or mid-hyphen. Each chunk
-    is at most of the specified chunk size.
+    is at most of the specified chunk size. Short texts go through textwrap; longer
+    ones are packed greedily with numpy, which joins words with single spaces.
 
     Args:
         text (str): The input text to be split into smaller chunks.
@@ -148,9 +199,18 @@ def _split_text(text: str, chunk_size: int = 250) -> list[str]:
         list[str]: A list of text chunks where each chunk is at most the
         specified size while preserving word integrity.
     """
+    if len(text) < SMALL_TEXT_LENGTH:
+        return textwrap.wrap(text, width=chunk_size, break_long_words=False, break_on_hyphens=False)
 
-    text_list = textwrap.wrap(
-        text, width=chunk_size, break_long_words=False, break_on_hyphens=False
+    words = text.split()
+    word_ends = np.cumsum(
+        np.fromiter((len(word) + 1 for word in words), dtype=np.int64, count=len(words))
     )
 
+    text_list = []
+    start = 0
+    for end in _break_indices(word_ends, chunk_size):
+        text_list.append(" ".join(words[start:end]))
+        start = end
+
     return text_list
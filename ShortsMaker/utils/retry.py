@@ -1,4 +1,5 @@
 import functools
+import random
 import time
 
 from .logging_config import get_logger
@@ -7,20 +8,37 @@ from .notify_discord import notify_discord
 logger = get_logger(__name__)
 
 
-def retry(max_retries: int, delay: int, notify: bool = False):
+def retry(
+    max_retries: int,
+    delay: float,
+    notify: bool = False,
+    max_delay: float | None = None,
+    backoff: float = 1.0,
+    jitter: float = 0.0,
+):
     """
     A retry decorator function that allows retrying a function based on the specified
     number of retries, delay between retries, and an option to send a notification upon
     failure. It logs all execution details, including successful executions, exceptions,
     and retry attempts.
 
+    The wait after the n-th failed attempt (counting from 0) is
+    ``delay * backoff**n``, scaled by a random factor in ``[1 - jitter, 1 + jitter]``
+    and capped at ``max_delay``. The defaults keep a fixed ``delay`` between attempts.
+
     Args:
         max_retries (int): The maximum number of times the function should be retried
             in case of an exception.
-        delay (int): The time in seconds to wait before retrying the function after
-            a failure.
+        delay (float): The time in seconds to wait before retrying the function after
+            the first failure.
         notify (bool): Whether to send a notification if the function fails after
             reaching the maximum number of retries. Default is False.
+        max_delay (float | None): Upper bound in seconds for a single wait. Default is
+            None, meaning no cap.
+        backoff (float): Multiplier applied to the wait after every failed attempt.
+            Default is 1.0, a constant delay.
+        jitter (float): Fraction by which each wait is randomly spread to avoid
+            retries from many callers lining up. Default is 0.0, no jitter.
 
     Returns:
         Callable: A decorator function that applies the retry logic to the decorated
@@ -31,7 +49,7 @@ def retry(max_retries: int, delay: int, notify: bool = False):
             exception from the last attempt will be raised.
 
     Example:
-    @retry(max_retries=3, delay=2)
+    @retry(max_retries=5, delay=1, max_delay=30, backoff=2.0, jitter=0.1)
     def my_function():
         # Function implementation
         pass
@@ -53,10 +71,17 @@ def retry(max_retries: int, delay: int, notify: bool = False):
                     )
                     return value
                 except Exception as e:
+                    wait = delay
+                    if backoff != 1:
+                        wait *= backoff**attempt
+                    if jitter:
+                        wait *= random.uniform(1 - jitter, 1 + jitter)
+                    if max_delay is not None:
+                        wait = min(wait, max_delay)
                     logger.exception(f"Exception: {e}")
-                    logger.warning(f"Retrying function {func.__name__} after {delay}s")
+                    logger.warning(f"Retrying function {func.__name__} after {round(wait, 2)}s")
                     err = str(e)
-                    time.sleep(delay)
+                    time.sleep(wait)
             if notify:
                 notify_discord(
                     f"{func.__name__} Failed after {max_retries} max_retries.\nException: {err}"
@@ -1,5 +1,4 @@
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -38,13 +37,10 @@ def test_initialization_with_invalid_config_path():
 
 
 def test_initialization_with_non_yaml_file(setup_file, tmp_path):
+    temp_path = tmp_path / "setup.txt"
+    temp_path.touch()
     with pytest.raises(ValueError):
-        temp_path = tempfile.NamedTemporaryFile(suffix=".txt", delete=False)
-        temp_path = Path(temp_path.name)
-        try:
-            AskLLM(config_file=temp_path)
-        finally:
-            temp_path.unlink()
+        AskLLM(config_file=temp_path)
 
 
 @patch("ShortsMaker.ask_llm.AskLLM._load_llm_model")
@@ -1,16 +1,58 @@
-from unittest.mock import MagicMock, patch
-
+import subprocess
+import time
+from contextlib import ExitStack
+from unittest.mock import DEFAULT, MagicMock, patch
+
+import httpx
+import ollama
+import psutil
 import pytest
 
 from ShortsMaker.ask_llm import OllamaServiceManager
 
 
+@pytest.fixture(scope="module")
+def ollama_mocks():
+    """Patches everything OllamaServiceManager reaches out to, once for the whole module.
+
+    The mocks are specced against the real objects, so a typo in an attribute fails the
+    test. They are reset before every test by `reset_ollama_mocks`.
+
+    Returns:
+        A dict of the mocks keyed by the name of the patched attribute.
+    """
+    with ExitStack() as stack:
+        mocks = {}
+        for target, names in (
+            (subprocess, ("Popen", "run", "check_output")),
+            (psutil, ("pids", "Process")),
+            (ollama, ("Client", "ps", "pull", "list")),
+            (time, ("monotonic", "sleep")),
+        ):
+            mocks.update(
+                stack.enter_context(
+                    patch.multiple(target, spec=True, **dict.fromkeys(names, DEFAULT))
+                )
+            )
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def reset_ollama_mocks(ollama_mocks):
+    for mock in ollama_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    # a fake clock that only moves when the code under test sleeps
+    clock = [0.0]
+    ollama_mocks["monotonic"].side_effect = lambda: clock[0]
+    ollama_mocks["sleep"].side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+
 @pytest.fixture
-def ollama_service_manager():
-    """Fixture to provide an instance of OllamaServiceManager with a mock logger.
+def ollama_service_manager(ollama_mocks):
+    """Fixture to provide an instance of OllamaServiceManager with the module mocks in place.
 
     Args:
-        mock_logger: A mock logger for the OllamaServiceManager.
+        ollama_mocks: The patched subprocess, psutil, ollama and time functions.
 
     Returns:
         An instance of OllamaServiceManager.
@@ -18,46 +60,93 @@ def ollama_service_manager():
     return OllamaServiceManager()
 
 
-@patch("ShortsMaker.ask_llm.subprocess.Popen")
-def test_start_service(mock_popen, ollama_service_manager):
-    process_mock = MagicMock()
-    process_mock.poll.return_value = None
-    mock_popen.return_value = process_mock
+def test_start_service(ollama_mocks, ollama_service_manager):
+    mock_popen = ollama_mocks["Popen"]
+    mock_popen.return_value.poll.return_value = None
 
     result = ollama_service_manager.start_service()
     assert result is True
     mock_popen.assert_called_once()
 
 
-@patch("ShortsMaker.ask_llm.subprocess.run")
-def test_stop_service_on_windows(mock_subprocess_run, ollama_service_manager):
-    ollama_service_manager.process = MagicMock()
+def test_start_service_waits_for_server(ollama_mocks, ollama_service_manager):
+    ollama_mocks["Popen"].return_value.poll.return_value = None
+    probe = ollama_mocks["Client"].return_value.ps
+    probe.side_effect = [ConnectionError, httpx.ReadError("reset"), MagicMock()]
+
+    result = ollama_service_manager.start_service()
+    assert result is True
+    assert probe.call_count == 3
+    delays = [call.args[0] for call in ollama_mocks["sleep"].call_args_list]
+    assert delays == pytest.approx([0.01, 0.02])
+
+
+def test_start_service_process_exits(ollama_mocks, ollama_service_manager):
+    process_mock = ollama_mocks["Popen"].return_value
+    process_mock.poll.return_value = 1
+    process_mock.returncode = 1
+
+    result = ollama_service_manager.start_service()
+    assert result is False
+    ollama_mocks["Client"].assert_not_called()
+
+
+def test_start_service_times_out_while_process_alive(ollama_mocks, ollama_service_manager):
+    ollama_mocks["Popen"].return_value.poll.return_value = None
+    ollama_mocks["Client"].return_value.ps.side_effect = httpx.RemoteProtocolError("no reply")
+    ollama_service_manager.logger = MagicMock()
+
+    result = ollama_service_manager.start_service(timeout=1.0)
+    assert result is True
+    ollama_service_manager.logger.warning.assert_called_once_with(
+        "Ollama service is running but not answering yet"
+    )
+    # neither the waits nor any single probe may run past the deadline
+    assert sum(call.args[0] for call in ollama_mocks["sleep"].call_args_list) <= 1.0
+    elapsed = 0.0
+    for client_call, sleep_call in zip(
+        ollama_mocks["Client"].call_args_list, ollama_mocks["sleep"].call_args_list
+    ):
+        assert 0 < client_call.kwargs["timeout"] <= 1.0 - elapsed
+        elapsed += sleep_call.args[0]
+
+
+def test_stop_service_on_windows(ollama_mocks, ollama_service_manager):
+    ollama_service_manager.process = ollama_mocks["Popen"].return_value
     ollama_service_manager.system = "windows"
     result = ollama_service_manager.stop_service()
     assert result is True
-    mock_subprocess_run.assert_called()
+    ollama_mocks["run"].assert_called()
 
 
-@patch("ShortsMaker.ask_llm.psutil.process_iter")
-def test_is_ollama_running(mock_process_iter, ollama_service_manager):
-    mock_process_iter.return_value = [
-        MagicMock(info={"name": "Ollama"}),
+def test_is_ollama_running(ollama_mocks, ollama_service_manager):
+    ollama_mocks["pids"].return_value = [1, 2]
+    ollama_mocks["Process"].side_effect = [
+        MagicMock(**{"name.side_effect": psutil.NoSuchProcess(1)}),
+        MagicMock(**{"name.return_value": "Ollama"}),
     ]
     result = ollama_service_manager.is_ollama_running()
     assert result is True
 
 
-def test_is_service_running_with_active_process(ollama_service_manager):
-    ollama_service_manager.process = MagicMock()
+def test_is_ollama_not_running(ollama_mocks, ollama_service_manager):
+    ollama_mocks["pids"].return_value = [1]
+    ollama_mocks["Process"].return_value.name.return_value = "python"
+    result = ollama_service_manager.is_ollama_running()
+    assert result is False
+
+
+def test_is_service_running_with_active_process(ollama_mocks, ollama_service_manager):
+    ollama_service_manager.process = ollama_mocks["Popen"].return_value
     ollama_service_manager.process.poll.return_value = None
 
     result = ollama_service_manager.is_service_running()
     assert result is True
 
 
-@patch("ShortsMaker.ask_llm.subprocess.check_output")
-def test_stop_running_model(mock_check_output, ollama_service_manager):
+def test_stop_running_model(ollama_mocks, ollama_service_manager):
     model_name = "test_model"
+    mock_check_output = ollama_mocks["check_output"]
     mock_check_output.return_value = "Stopped"
 
     result = ollama_service_manager.stop_running_model(model_name)
@@ -65,17 +154,16 @@ def test_stop_running_model(mock_check_output, ollama_service_manager):
     mock_check_output.assert_called_with(["ollama", "stop", model_name], stderr=-2, text=True)
 
 
-@patch("ShortsMaker.ask_llm.ollama.ps")
-def test_get_running_models(mock_ollama_ps, ollama_service_manager):
-    mock_ollama_ps.return_value = ["model1", "model2"]
+def test_get_running_models(ollama_mocks, ollama_service_manager):
+    ollama_mocks["ps"].return_value = ["model1", "model2"]
 
     result = ollama_service_manager.get_running_models()
     assert result == ["model1", "model2"]
 
 
-@patch("ShortsMaker.ask_llm.ollama.pull")
-def test_get_llm_model(mock_ollama_pull, ollama_service_manager):
+def test_get_llm_model(ollama_mocks, ollama_service_manager):
     model_name = "test_model"
+    mock_ollama_pull = ollama_mocks["pull"]
     mock_ollama_pull.return_value = "model_data"
 
     result = ollama_service_manager.get_llm_model(model_name)
@@ -83,12 +171,10 @@ def test_get_llm_model(mock_ollama_pull, ollama_service_manager):
     mock_ollama_pull.assert_called_with(model_name)
 
 
-@patch("ShortsMaker.ask_llm.ollama.list")
-def test_get_list_of_downloaded_files(mock_ollama_list, ollama_service_manager):
-    mock_ollama_list.return_value = [("models", [MagicMock(), MagicMock(), MagicMock()])]
-    mock_ollama_list.return_value[0][1][0].model = "submodel1"
-    mock_ollama_list.return_value[0][1][1].model = "submodel2"
-    mock_ollama_list.return_value[0][1][2].model = "submodel3"
+def test_get_list_of_downloaded_files(ollama_mocks, ollama_service_manager):
+    ollama_mocks["list"].return_value = MagicMock(
+        models=[MagicMock(model=f"submodel{i}") for i in range(1, 4)]
+    )
 
     result = ollama_service_manager.get_list_of_downloaded_files()
     assert result == ["submodel1", "submodel2", "submodel3"]
@@ -1,19 +1,73 @@
+import copy
+import json
 import logging
 from pathlib import Path
 
 import pytest
+import yaml
 
 from ShortsMaker import ShortsMaker
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-@pytest.fixture
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="run tests marked as slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
 def setup_file():
-    return Path(__file__).parent / "data" / "setup.yml"
+    return DATA_DIR / "setup.yml"
+
+
+@pytest.fixture(scope="session")
+def setup_file_cfg(setup_file):
+    """The parsed setup file. Shared across the session, so tests must not mutate it."""
+    with open(setup_file, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+@pytest.fixture(scope="session")
+def expected_transcript():
+    """The sample word transcript. Shared across the session, so tests must not mutate it."""
+    with open(DATA_DIR / "transcript.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def shorts_maker(setup_file, tmp_path_factory):
+    """
+    A ShortsMaker shared by the whole session (one per pytest-xdist worker).
+    Its cache directory is a session temporary directory, so tests that assert on
+    files they write into the cache should use shorts_maker_isolated instead.
+    """
+    maker = ShortsMaker(setup_file)
+    maker.cache_dir = tmp_path_factory.mktemp("cache")
+    return maker
 
 
 @pytest.fixture
-def shorts_maker(setup_file):
-    return ShortsMaker(setup_file)
+def shorts_maker_isolated(shorts_maker, tmp_path):
+    """A shallow copy of the session ShortsMaker whose cache directory is the test's tmp_path."""
+    maker = copy.copy(shorts_maker)
+    maker.cache_dir = tmp_path
+    return maker
 
 
 @pytest.fixture
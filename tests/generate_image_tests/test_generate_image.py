@@ -1,4 +1,3 @@
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -25,14 +24,11 @@ def test_initialization_with_non_existent_file():
         GenerateImage(config_file=Path("non_existent_file.yml"))
 
 
-def test_initialization_with_invalid_file_format():
+def test_initialization_with_invalid_file_format(tmp_path):
+    temp_path = tmp_path / "setup.txt"
+    temp_path.touch()
     with pytest.raises(ValueError):
-        temp_path = tempfile.NamedTemporaryFile(suffix=".txt", delete=False)
-        temp_path = Path(temp_path.name)
-        try:
-            GenerateImage(config_file=temp_path)
-        finally:
-            temp_path.unlink()
+        GenerateImage(config_file=temp_path)
 
 
 def test_load_model_failure(generate_image):
@@ -41,20 +37,20 @@ def test_load_model_failure(generate_image):
 
 
 @patch("ShortsMaker.generate_image.GenerateImage._load_model")
-def test_use_huggingface_flux_dev_success(mock_load_model, generate_image):
+def test_use_huggingface_flux_dev_success(mock_load_model, generate_image, tmp_path):
     mock_load_model.return_value = True
     generate_image.pipe = MagicMock()
     output = generate_image.use_huggingface_flux_dev(
-        prompt="Random stuff", output_path="random_path.png"
+        prompt="Random stuff", output_path=tmp_path / "random_path.png"
     )
     assert output is not None
 
 
 @patch("ShortsMaker.generate_image.GenerateImage._load_model")
-def test_use_huggingface_flux_schnell_success(mock_load_model, generate_image):
+def test_use_huggingface_flux_schnell_success(mock_load_model, generate_image, tmp_path):
     mock_load_model.return_value = True
     generate_image.pipe = MagicMock()
     output = generate_image.use_huggingface_flux_schnell(
-        prompt="Random stuff", output_path="random_path.png"
+        prompt="Random stuff", output_path=tmp_path / "random_path.png"
     )
     assert output is not None
@@ -1,4 +1,5 @@
 import random
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,12 +8,21 @@ from moviepy import AudioFileClip, VideoFileClip
 
 from ShortsMaker import MoviepyCreateVideo, VideoConfig
 
+_TEST_WAV = Path(__file__).resolve().parent.parent / "data" / "test.wav"
+
+
+@pytest.fixture(autouse=True, scope="module")
+def mock_subprocess_run():
+    """Stubs the FFmpeg verification call made by every MoviepyCreateVideo constructor."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        yield mock_run
+
 
 @pytest.fixture
-def mock_audio_file(tmp_path):
-    """Creates a mock audio file path."""
-    audio_file = Path(__file__).parent.parent / "data" / "test.wav"
-    return audio_file
+def mock_audio_file():
+    """Returns the path of the sample audio file."""
+    return _TEST_WAV
 
 
 @pytest.fixture
@@ -52,14 +62,55 @@ def mock_credits_files(tmp_path):
     return credits_dir
 
 
+# Media initializers stubbed out by `patch_components`, in constructor call order
+_COMPONENT_METHODS = (
+    "_initialize_audio",
+    "_load_transcript",
+    "preprocess_audio_transcript",
+    "_initialize_background_video",
+    "prepare_background_video",
+    "_initialize_music",
+    "_initialize_font",
+    "_initialize_credits",
+)
+
+
+@pytest.fixture
+def patch_components(mock_audio_clip):
+    """
+    Returns a helper that patches every media initializer of MoviepyCreateVideo
+    except the ones passed by name, so a test only exercises the component under test.
+    Keyword arguments override the return value of a patched initializer.
+    The patches are undone when the test finishes.
+    """
+    with ExitStack() as stack:
+
+        def _patch_components(*unpatched: str, **return_values):
+            return_values.setdefault("_initialize_audio", mock_audio_clip)
+            for name in _COMPONENT_METHODS:
+                if name in unpatched:
+                    continue
+                kwargs = {"return_value": return_values[name]} if name in return_values else {}
+                stack.enter_context(patch.object(MoviepyCreateVideo, name, **kwargs))
+            stack.enter_context(
+                patch.object(
+                    MoviepyCreateVideo,
+                    "process_audio_transcript_to_word_and_sentences_transcript",
+                    return_value=([], []),
+                )
+            )
+
+        yield _patch_components
+
+
 class TestMoviepyCreateVideo:
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
     def test_init_and_ffmpeg_verification(
-        self, mock_subprocess_run, mock_get_logger, setup_file, mock_audio_file, mock_video_clip
+        self, mock_get_logger, mock_subprocess_run, setup_file, mock_audio_file, mock_video_clip
     ):
         """Test initialization and FFmpeg verification."""
         # Setup
+        mock_subprocess_run.reset_mock()
         mock_logger = MagicMock()
         mock_get_logger.return_value = mock_logger
 
@@ -130,159 +181,79 @@ class TestMoviepyCreateVideo:
         with pytest.raises(ValueError, match="Invalid configuration file"):
             MoviepyCreateVideo._load_configuration(invalid_file)
 
+    @pytest.mark.parametrize(
+        "audio_arg_type", [None, str, Path], ids=["from_config", "str_path", "path"]
+    )
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_initialize_audio_with_path(
-        self, mock_subprocess_run, mock_get_logger, setup_file, mock_audio_file, mock_audio_clip
+    def test_initialize_audio(
+        self,
+        mock_get_logger,
+        audio_arg_type,
+        patch_components,
+        setup_file,
+        setup_file_cfg,
+        mock_audio_file,
+        mock_audio_clip,
     ):
-        """Test initializing audio with an explicit path."""
-        with (
-            patch(
-                "ShortsMaker.moviepy_create_video.AudioFileClip", return_value=mock_audio_clip
-            ) as mock_audio_file_clip,
-            patch.object(MoviepyCreateVideo, "_initialize_background_video"),
-            patch.object(MoviepyCreateVideo, "_load_transcript"),
-            patch.object(MoviepyCreateVideo, "preprocess_audio_transcript"),
-            patch.object(
-                MoviepyCreateVideo,
-                "process_audio_transcript_to_word_and_sentences_transcript",
-                return_value=([], []),
-            ),
-            patch.object(MoviepyCreateVideo, "prepare_background_video"),
-            patch.object(MoviepyCreateVideo, "_initialize_music"),
-            patch.object(MoviepyCreateVideo, "_initialize_font"),
-            patch.object(MoviepyCreateVideo, "_initialize_credits"),
-        ):
-            mock_logger = MagicMock()
-            mock_get_logger.return_value = mock_logger
-
-            MoviepyCreateVideo(config_file=setup_file, audio_path=str(mock_audio_file))
-
-            mock_audio_file_clip.assert_called_once_with(str(mock_audio_file))
-            mock_logger.info.assert_any_call(f"Audio Duration: {mock_audio_clip.duration:.2f}s")
+        """Test initializing audio with and without an explicit path."""
+        audio_arg = audio_arg_type(mock_audio_file) if audio_arg_type else None
+        if audio_arg is None:
+            expected_audio_path = (
+                Path(setup_file_cfg["cache_dir"]) / setup_file_cfg["audio"]["output_audio_file"]
+            )
+        else:
+            expected_audio_path = audio_arg
 
-    @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_initialize_audio_without_path(
-        self, mock_subprocess_run, mock_get_logger, setup_file, mock_audio_file, mock_audio_clip
-    ):
-        """Test initializing audio without an explicit path."""
-        with (
-            patch(
-                "ShortsMaker.moviepy_create_video.AudioFileClip", return_value=mock_audio_clip
-            ) as mock_audio_file_clip,
-            patch.object(MoviepyCreateVideo, "_initialize_background_video"),
-            patch.object(MoviepyCreateVideo, "_load_transcript"),
-            patch.object(MoviepyCreateVideo, "preprocess_audio_transcript"),
-            patch.object(
-                MoviepyCreateVideo,
-                "process_audio_transcript_to_word_and_sentences_transcript",
-                return_value=([], []),
-            ),
-            patch.object(MoviepyCreateVideo, "prepare_background_video"),
-            patch.object(MoviepyCreateVideo, "_initialize_music"),
-            patch.object(MoviepyCreateVideo, "_initialize_font"),
-            patch.object(MoviepyCreateVideo, "_initialize_credits"),
-        ):
+        patch_components("_initialize_audio")
+        with patch(
+            "ShortsMaker.moviepy_create_video.AudioFileClip", return_value=mock_audio_clip
+        ) as mock_audio_file_clip:
             mock_logger = MagicMock()
             mock_get_logger.return_value = mock_logger
-            # Check that it used the path from config
-            expected_audio_path = Path(__file__).parent.parent / "data" / "test.wav"
 
-            MoviepyCreateVideo(config_file=setup_file, audio_path=expected_audio_path)
+            MoviepyCreateVideo(config_file=setup_file, audio_path=audio_arg)
 
             mock_audio_file_clip.assert_called_once_with(expected_audio_path)
+            mock_logger.info.assert_any_call(f"Audio Duration: {mock_audio_clip.duration:.2f}s")
 
+    @pytest.mark.parametrize("from_url", [True, False], ids=["url", "path"])
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
     @patch("ShortsMaker.moviepy_create_video.download_youtube_video")
-    def test_initialize_background_video_with_url(
+    def test_initialize_background_video(
         self,
         mock_download,
-        mock_subprocess_run,
         mock_get_logger,
-        mock_audio_clip,
+        from_url,
+        patch_components,
         setup_file,
         mock_video_clip,
         tmp_path,
     ):
-        """Test initializing background video with a URL."""
+        """Test initializing background video from a configured URL or an explicit path."""
+        video_path = tmp_path / "test_video.mp4"
+        mock_download.return_value = [video_path]
+
+        patch_components("_initialize_background_video", prepare_background_video=mock_video_clip)
         with (
             patch(
                 "ShortsMaker.moviepy_create_video.VideoFileClip", return_value=mock_video_clip
             ) as mock_video_file_clip,
-            patch.object(MoviepyCreateVideo, "_initialize_audio", return_value=mock_audio_clip),
-            patch.object(
-                MoviepyCreateVideo,
-                "process_audio_transcript_to_word_and_sentences_transcript",
-                return_value=([], []),
-            ),
-            patch.object(MoviepyCreateVideo, "_load_transcript"),
-            patch.object(MoviepyCreateVideo, "preprocess_audio_transcript"),
-            patch.object(
-                MoviepyCreateVideo, "prepare_background_video", return_value=mock_video_clip
-            ),
-            patch.object(MoviepyCreateVideo, "_initialize_music"),
-            patch.object(MoviepyCreateVideo, "_initialize_font"),
-            patch.object(MoviepyCreateVideo, "_initialize_credits"),
+            # Mock random.choice to always pick the first URL
+            patch("random.choice", side_effect=lambda x: x[0]),
         ):
-            mock_logger = MagicMock()
-            mock_get_logger.return_value = mock_logger
-
-            # Mock the download function to return a list of video paths
-            test_video_path = tmp_path / "test_video.mp4"
-            mock_download.return_value = [test_video_path]
+            mock_get_logger.return_value = MagicMock()
 
-            # Mock random.choice to always pick the first URL
-            with patch("random.choice", side_effect=lambda x: x[0]):
-                MoviepyCreateVideo(config_file=setup_file)
+            MoviepyCreateVideo(
+                config_file=setup_file, bg_video_path=None if from_url else str(video_path)
+            )
 
+        if from_url:
             # Verify download was called with the right URL
             mock_download.assert_called_once()
             assert mock_download.call_args[0][0] == "https://www.youtube.com/watch?v=n_Dv4JMiwK8"
-
-            # Verify VideoFileClip was initialized with the right path
-            mock_video_file_clip.assert_called_once_with(test_video_path, audio=False)
-
-    @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_initialize_background_video_with_path(
-        self,
-        mock_subprocess_run,
-        mock_get_logger,
-        mock_audio_clip,
-        setup_file,
-        mock_video_clip,
-        tmp_path,
-    ):
-        """Test initializing background video with an explicit path."""
-        video_path = tmp_path / "test_video.mp4"
-        video_path.touch()
-
-        with (
-            patch(
-                "ShortsMaker.moviepy_create_video.VideoFileClip", return_value=mock_video_clip
-            ) as mock_video_file_clip,
-            patch.object(MoviepyCreateVideo, "_initialize_audio", return_value=mock_audio_clip),
-            patch.object(
-                MoviepyCreateVideo,
-                "process_audio_transcript_to_word_and_sentences_transcript",
-                return_value=([], []),
-            ),
-            patch.object(MoviepyCreateVideo, "_load_transcript"),
-            patch.object(MoviepyCreateVideo, "preprocess_audio_transcript"),
-            patch.object(
-                MoviepyCreateVideo, "prepare_background_video", return_value=mock_video_clip
-            ),
-            patch.object(MoviepyCreateVideo, "_initialize_music"),
-            patch.object(MoviepyCreateVideo, "_initialize_font"),
-            patch.object(MoviepyCreateVideo, "_initialize_credits"),
-        ):
-            mock_logger = MagicMock()
-            mock_get_logger.return_value = mock_logger
-
-            MoviepyCreateVideo(config_file=setup_file, bg_video_path=str(video_path))
-
+            mock_video_file_clip.assert_called_once_with(video_path, audio=False)
+        else:
+            mock_download.assert_not_called()
             mock_video_file_clip.assert_called_once_with(str(video_path), audio=False)
 
     def test_select_random_color(self):
@@ -300,10 +271,7 @@ class TestMoviepyCreateVideo:
         assert all(0 <= c <= 255 for c in color)
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_load_transcript(
-        self, mock_subprocess_run, mock_get_logger, mock_audio_clip, setup_file
-    ):
+    def test_load_transcript(self, mock_get_logger, mock_audio_clip, setup_file):
         """Test loading a transcript file."""
         with (
             patch.object(MoviepyCreateVideo, "_initialize_audio", return_value=mock_audio_clip),
@@ -335,9 +303,8 @@ class TestMoviepyCreateVideo:
             assert isinstance(transcript, list)
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
     def test_initialize_font_with_provided_path(
-        self, mock_subprocess_run, mock_get_logger, mock_audio_clip, setup_file, mock_font_file
+        self, mock_get_logger, mock_audio_clip, setup_file, mock_font_file
     ):
         """Test initializing font with an explicit path."""
         with (
@@ -362,9 +329,8 @@ class TestMoviepyCreateVideo:
             assert creator.font_path == str(mock_font_file)
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
     def test_initialize_font_without_path(
-        self, mock_subprocess_run, mock_get_logger, mock_audio_clip, setup_file, mock_font_file
+        self, mock_get_logger, mock_audio_clip, setup_file, mock_font_file
     ):
         """Test initializing font without an explicit path."""
         with (
@@ -392,9 +358,8 @@ class TestMoviepyCreateVideo:
             assert creator.font_path == mock_font_file.absolute()
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
     def test_initialize_credits(
-        self, mock_subprocess_run, mock_get_logger, mock_audio_clip, setup_file, mock_credits_files
+        self, mock_get_logger, mock_audio_clip, setup_file, mock_credits_files
     ):
         """Test initializing credits files."""
         with (
@@ -497,9 +462,8 @@ class TestMoviepyCreateVideo:
         assert sentences_transcript[1]["sentence"] == "This is a test. "
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
     def test_prepare_background_video(
-        self, mock_subprocess_run, mock_get_logger, setup_file, mock_video_clip, mock_audio_clip
+        self, mock_get_logger, setup_file, mock_video_clip, mock_audio_clip
     ):
         """Test preparing the background video."""
         with (
@@ -539,10 +503,7 @@ class TestMoviepyCreateVideo:
             mock_video_clip.with_effects.assert_called_once()
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_create_text_clips(
-        self, mock_subprocess_run, mock_get_logger, setup_file, mock_video_clip, mock_audio_clip
-    ):
+    def test_create_text_clips(self, mock_get_logger, setup_file, mock_video_clip, mock_audio_clip):
         """Test creating text clips."""
         with (
             patch.object(MoviepyCreateVideo, "_initialize_audio", return_value=mock_audio_clip),
@@ -589,10 +550,7 @@ class TestMoviepyCreateVideo:
             assert mock_text_clip.call_count == 2
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_prepare_audio(
-        self, mock_subprocess_run, mock_get_logger, setup_file, mock_video_clip, mock_audio_clip
-    ):
+    def test_prepare_audio(self, mock_get_logger, setup_file, mock_video_clip, mock_audio_clip):
         """Test preparing audio."""
         with (
             patch.object(MoviepyCreateVideo, "_initialize_audio", return_value=mock_audio_clip),
@@ -643,10 +601,7 @@ class TestMoviepyCreateVideo:
             assert result is mock_composite
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_call(
-        self, mock_subprocess_run, mock_get_logger, setup_file, mock_video_clip, mock_audio_clip
-    ):
+    def test_call(self, mock_get_logger, setup_file, mock_video_clip, mock_audio_clip):
         """Test the __call__ method."""
         with (
             patch.object(MoviepyCreateVideo, "_initialize_audio", return_value=mock_audio_clip),
@@ -706,115 +661,83 @@ class TestMoviepyCreateVideo:
             assert result
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_quit(self, mock_subprocess_run, mock_get_logger, setup_file, mock_audio_clip):
+    def test_quit(self, mock_get_logger, patch_components, setup_file):
         """Test the quit method for proper cleanup of resources."""
-        with (
-            patch.object(MoviepyCreateVideo, "_initialize_audio", return_value=mock_audio_clip),
-            patch.object(
-                MoviepyCreateVideo,
-                "process_audio_transcript_to_word_and_sentences_transcript",
-                return_value=([], []),
-            ),
-            patch.object(MoviepyCreateVideo, "_initialize_background_video"),
-            patch.object(MoviepyCreateVideo, "prepare_background_video"),
-            patch.object(MoviepyCreateVideo, "_load_transcript"),
-            patch.object(MoviepyCreateVideo, "preprocess_audio_transcript"),
-            patch.object(MoviepyCreateVideo, "_initialize_music"),
-            patch.object(MoviepyCreateVideo, "_initialize_font"),
-            patch.object(MoviepyCreateVideo, "_initialize_credits"),
-        ):
-            mock_logger = MagicMock()
-            mock_get_logger.return_value = mock_logger
-
-            # Create instance with mock resources
-            creator = MoviepyCreateVideo(config_file=setup_file)
+        patch_components()
 
-            # Create mock clips
-            mock_audio_clip = MagicMock()
-            mock_bg_video = MagicMock()
-            mock_music_clip = MagicMock()
-            mock_credits_video = MagicMock()
-            mock_credit_video_mask = MagicMock()
+        mock_logger = MagicMock()
+        mock_get_logger.return_value = mock_logger
 
-            # Set mock clips as instance attributes
-            creator.audio_clip = mock_audio_clip
-            creator.bg_video = mock_bg_video
-            creator.music_clip = mock_music_clip
-            creator.credits_video = mock_credits_video
-            creator.credit_video_mask = mock_credit_video_mask
-
-            # Add some test attributes
-            creator.test_attr = "test"
-
-            # Call quit method
-            creator.quit()
-
-            # Verify all clips were closed
-            mock_audio_clip.close.assert_called_once()
-            mock_bg_video.close.assert_called_once()
-            mock_music_clip.close.assert_called_once()
-            mock_credits_video.close.assert_called_once()
-            mock_credit_video_mask.close.assert_called_once()
-
-            # Verify debug logs were called
-            mock_logger.debug.assert_any_call("Resources successfully cleaned up.")
-
-            # Verify attributes were deleted
-            assert not hasattr(creator, "test_attr")
-            assert not hasattr(creator, "audio_clip")
-            assert not hasattr(creator, "bg_video")
-            assert not hasattr(creator, "music_clip")
-            assert not hasattr(creator, "credits_video")
-            assert not hasattr(creator, "credit_video_mask")
-
-            # Verify logger was preserved
-            assert hasattr(creator, "logger")
+        # Create instance with mock resources
+        creator = MoviepyCreateVideo(config_file=setup_file)
+
+        # Create mock clips
+        mock_audio_clip = MagicMock()
+        mock_bg_video = MagicMock()
+        mock_music_clip = MagicMock()
+        mock_credits_video = MagicMock()
+        mock_credit_video_mask = MagicMock()
+
+        # Set mock clips as instance attributes
+        creator.audio_clip = mock_audio_clip
+        creator.bg_video = mock_bg_video
+        creator.music_clip = mock_music_clip
+        creator.credits_video = mock_credits_video
+        creator.credit_video_mask = mock_credit_video_mask
+
+        # Add some test attributes
+        creator.test_attr = "test"
+
+        # Call quit method
+        creator.quit()
+
+        # Verify all clips were closed
+        mock_audio_clip.close.assert_called_once()
+        mock_bg_video.close.assert_called_once()
+        mock_music_clip.close.assert_called_once()
+        mock_credits_video.close.assert_called_once()
+        mock_credit_video_mask.close.assert_called_once()
+
+        # Verify debug logs were called
+        mock_logger.debug.assert_any_call("Resources successfully cleaned up.")
+
+        # Verify attributes were deleted
+        assert not hasattr(creator, "test_attr")
+        assert not hasattr(creator, "audio_clip")
+        assert not hasattr(creator, "bg_video")
+        assert not hasattr(creator, "music_clip")
+        assert not hasattr(creator, "credits_video")
+        assert not hasattr(creator, "credit_video_mask")
+
+        # Verify logger was preserved
+        assert hasattr(creator, "logger")
 
     @patch("ShortsMaker.moviepy_create_video.get_logger")
-    @patch("subprocess.run")
-    def test_quit_with_errors(
-        self, mock_subprocess_run, mock_get_logger, setup_file, mock_audio_clip, mock_video_clip
-    ):
+    def test_quit_with_errors(self, mock_get_logger, patch_components, setup_file, mock_video_clip):
         """Test the quit method handles errors gracefully during cleanup."""
-        with (
-            patch.object(MoviepyCreateVideo, "_initialize_audio", return_value=mock_audio_clip),
-            patch.object(
-                MoviepyCreateVideo,
-                "process_audio_transcript_to_word_and_sentences_transcript",
-                return_value=([], []),
-            ),
-            patch.object(
-                MoviepyCreateVideo, "_initialize_background_video", return_value=mock_video_clip
-            ),
-            patch.object(MoviepyCreateVideo, "prepare_background_video"),
-            patch.object(MoviepyCreateVideo, "_load_transcript"),
-            patch.object(MoviepyCreateVideo, "preprocess_audio_transcript"),
-            patch.object(MoviepyCreateVideo, "_initialize_music"),
-            patch.object(MoviepyCreateVideo, "_initialize_font"),
-            patch.object(MoviepyCreateVideo, "_initialize_credits"),
-        ):
-            mock_logger = MagicMock()
-            mock_get_logger.return_value = mock_logger
+        patch_components(_initialize_background_video=mock_video_clip)
 
-            # Create instance with mock resources
-            creator = MoviepyCreateVideo(config_file=setup_file)
+        mock_logger = MagicMock()
+        mock_get_logger.return_value = mock_logger
+
+        # Create instance with mock resources
+        creator = MoviepyCreateVideo(config_file=setup_file)
 
-            # Create mock clip that raises an exception on close
-            mock_problematic_clip = MagicMock()
-            mock_problematic_clip.close.side_effect = Exception("Test error")
+        # Create mock clip that raises an exception on close
+        mock_problematic_clip = MagicMock()
+        mock_problematic_clip.close.side_effect = Exception("Test error")
 
-            # Set mock clip as instance attribute
-            creator.audio_clip = mock_problematic_clip
+        # Set mock clip as instance attribute
+        creator.audio_clip = mock_problematic_clip
 
-            # Call quit method
-            creator.quit()
+        # Call quit method
+        creator.quit()
 
-            # Verify error was logged
-            mock_logger.error.assert_any_call("Error closing resources: Test error")
+        # Verify error was logged
+        mock_logger.error.assert_any_call("Error closing resources: Test error")
 
-            # Verify cleanup completed despite error
-            mock_logger.debug.assert_called_with("Resources successfully cleaned up.")
+        # Verify cleanup completed despite error
+        mock_logger.debug.assert_called_with("Resources successfully cleaned up.")
 
-            # Verify problematic attribute was attempted to be deleted
-            assert not hasattr(creator, "audio_clip")
+        # Verify problematic attribute was attempted to be deleted
+        assert not hasattr(creator, "audio_clip")
@@ -1,11 +1,12 @@
+import json
 import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-import yaml
 
 from ShortsMaker import ShortsMaker
+from ShortsMaker.utils import audio_transcript
 
 
 def test_validate_config_path_valid(tmp_path):
@@ -117,13 +118,13 @@ def test_generate_audio_random_speaker(mock_choice, shorts_maker):
         mock_choice.assert_called_once()
 
 
-def test_generate_audio_text_processing(shorts_maker):
+def test_generate_audio_text_processing(shorts_maker_isolated):
     # Test text processing functionality
     source_text = "Test123 text AITA for YTA"
-    output_script = shorts_maker.cache_dir / "test_script.txt"
+    output_script = shorts_maker_isolated.cache_dir / "test_script.txt"
 
     with patch("ShortsMaker.shorts_maker.tts"):
-        shorts_maker.generate_audio(source_text, output_script_file=output_script)
+        shorts_maker_isolated.generate_audio(source_text, output_script_file=output_script)
 
         with open(output_script) as f:
             processed_text = f.read()
@@ -164,6 +165,7 @@ def test_generate_audio_transcript(mock_transcription, shorts_maker, tmp_path):
         model=shorts_maker.audio_cfg["model"],
         batch_size=shorts_maker.audio_cfg["batch_size"],
         compute_type=shorts_maker.audio_cfg["compute_type"],
+        cleanup=True,
     )
 
     # Verify result contains filtered transcript
@@ -171,34 +173,57 @@ def test_generate_audio_transcript(mock_transcription, shorts_maker, tmp_path):
 
     # Verify transcript was saved to file
     with open(output_file) as f:
-        saved_transcript = yaml.safe_load(f)
+        saved_transcript = json.load(f)
     assert saved_transcript == mock_transcript
 
 
 @patch("ShortsMaker.shorts_maker.generate_audio_transcription")
-def test_generate_audio_transcript_default_output(mock_generate_audio_transcription, shorts_maker):
+def test_generate_audio_transcript_default_output(
+    mock_generate_audio_transcription, shorts_maker_isolated, expected_transcript
+):
     # Test default output file name generation
     source_audio = Path(__file__).parent.parent / "data" / "test.wav"
     source_text = Path(__file__).parent.parent / "data" / "test.txt"
-    with open(Path(__file__).parent.parent / "data" / "transcript.json") as f:
-        expected_transcript = yaml.safe_load(f)
 
     mock_generate_audio_transcription.return_value = expected_transcript
-    result = shorts_maker.generate_audio_transcript(source_audio, source_text)
+    result = shorts_maker_isolated.generate_audio_transcript(source_audio, source_text)
 
-    expected_output = shorts_maker.cache_dir / shorts_maker.audio_cfg["transcript_json"]
+    expected_output = (
+        shorts_maker_isolated.cache_dir / shorts_maker_isolated.audio_cfg["transcript_json"]
+    )
     assert expected_output.exists()
     mock_generate_audio_transcription.assert_called_once()
     assert result == expected_transcript
 
 
+@patch("ShortsMaker.utils.audio_transcript.whisperx")
+def test_generate_audio_transcript_releases_models(mock_whisperx, shorts_maker_isolated):
+    source_audio = Path(__file__).parent.parent / "data" / "test.wav"
+    source_text = Path(__file__).parent.parent / "data" / "test.txt"
+    audio_transcript._load_whisper_model.cache_clear()
+    audio_transcript._load_align_model.cache_clear()
+    mock_whisperx.load_model.return_value.transcribe.return_value = {
+        "segments": [{"text": "hello", "start": 0.0, "end": 0.5}],
+        "language": "en",
+    }
+    mock_whisperx.load_align_model.return_value = (MagicMock(), MagicMock())
+    mock_whisperx.align.return_value = {
+        "segments": [{"words": [{"word": "hello", "start": 0.0, "end": 0.5}]}]
+    }
+
+    shorts_maker_isolated.generate_audio_transcript(source_audio, source_text, debug=False)
+
+    # the models must not outlive the transcription in a single-shot pipeline
+    mock_whisperx.load_model.assert_called_once()
+    assert audio_transcript._load_whisper_model.cache_info().currsize == 0
+    assert audio_transcript._load_align_model.cache_info().currsize == 0
+
+
 @pytest.mark.skipif("RUNALL" not in os.environ, reason="takes too long")
-def test_generate_audio_transcript_with_whisperx(shorts_maker):
+def test_generate_audio_transcript_with_whisperx(shorts_maker, expected_transcript):
     # Test default output file name generation
     source_audio = Path(__file__).parent.parent / "data" / "test.wav"
     source_text = Path(__file__).parent.parent / "data" / "test.txt"
-    with open(Path(__file__).parent.parent / "data" / "transcript.json") as f:
-        expected_transcript = yaml.safe_load(f)
 
     result = shorts_maker.generate_audio_transcript(source_audio, source_text)
 
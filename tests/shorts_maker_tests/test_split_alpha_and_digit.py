@@ -39,3 +39,11 @@ def test_split_alpha_and_digit_with_spaces_and_tabs():
 def test_split_alpha_and_digit_with_uppercase_and_numbers():
     result = split_alpha_and_digit("ABC123")
     assert result == "ABC 123"
+
+
+def test_split_alpha_and_digit_with_non_ascii_numerics():
+    # str.isdigit / str.isalpha decide the groups, not the regex classes
+    assert split_alpha_and_digit("m²") == "m ²"
+    assert split_alpha_and_digit("CO₂") == "CO ₂"
+    assert split_alpha_and_digit("2½") == "2½"
+    assert split_alpha_and_digit("café9") == "café 9"
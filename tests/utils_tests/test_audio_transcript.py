@@ -2,6 +2,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ShortsMaker.utils import audio_transcript
 from ShortsMaker.utils.audio_transcript import (
     align_transcript_with_script,
     generate_audio_transcription,
@@ -88,6 +89,9 @@ def test_align_transcript_timing_preserved():
 
 @pytest.fixture
 def mock_whisperx():
+    # models loaded from a previous test's mock must not be served from the cache
+    audio_transcript._load_whisper_model.cache_clear()
+    audio_transcript._load_align_model.cache_clear()
     with patch("ShortsMaker.utils.audio_transcript.whisperx") as mock_wx:
         # Mock the load_model and model.transcribe
         mock_model = MagicMock()
@@ -137,13 +141,24 @@ def test_generate_audio_transcription_model_cleanup(mock_whisperx):
         with patch("ShortsMaker.utils.audio_transcript.torch") as mock_torch:
             mock_torch.cuda.is_available.return_value = True
 
-            generate_audio_transcription(audio_file="test.wav", script="hello world")
+            generate_audio_transcription(audio_file="test.wav", script="hello world", cleanup=True)
 
             # Verify cleanup calls
             assert mock_gc.collect.call_count == 2
             assert mock_torch.cuda.empty_cache.call_count == 2
 
 
+def test_generate_audio_transcription_reuses_models(mock_whisperx):
+    with patch("ShortsMaker.utils.audio_transcript.gc") as mock_gc:
+        for _ in range(2):
+            generate_audio_transcription(audio_file="test.wav", script="hello world")
+
+    assert mock_whisperx.load_model.call_count == 1
+    assert mock_whisperx.load_align_model.call_count == 1
+    assert mock_whisperx.load_audio.call_count == 2
+    mock_gc.collect.assert_not_called()
+
+
 def test_generate_audio_transcription_missing_timestamps(mock_whisperx):
     # Mock align to return words without timestamps
     mock_whisperx.align.return_value = {
@@ -175,3 +190,18 @@ def test_generate_audio_transcription_parameters(mock_whisperx):
     mock_whisperx.load_model.assert_called_with("medium", "test_device", compute_type="float32")
 
     mock_whisperx.load_align_model.assert_called_with(language_code="en", device="test_device")
+
+
+@pytest.mark.parametrize(
+    "device, cuda_available, expected",
+    [("cuda", True, "float16"), ("cuda", False, "int8"), ("cpu", True, "int8")],
+)
+def test_generate_audio_transcription_default_compute_type(
+    mock_whisperx, device, cuda_available, expected
+):
+    with patch("ShortsMaker.utils.audio_transcript.torch") as mock_torch:
+        mock_torch.cuda.is_available.return_value = cuda_available
+
+        generate_audio_transcription(audio_file="test.wav", script="hello world", device=device)
+
+    mock_whisperx.load_model.assert_called_with("large-v2", device, compute_type=expected)
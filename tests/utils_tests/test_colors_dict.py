@@ -1,17 +1,23 @@
-from ShortsMaker import COLORS_DICT
+from collections.abc import Mapping
+
+import numpy as np
+import pytest
+
+from ShortsMaker import COLOR_NAMES, COLORS_ARRAY, COLORS_DICT, lookup_color
 
 
 def test_colors_dict_structure():
-    # Test that COLORS_DICT is a dictionary
-    assert isinstance(COLORS_DICT, dict)
+    # Test that COLORS_DICT is a read-only mapping
+    assert isinstance(COLORS_DICT, Mapping)
+    assert not isinstance(COLORS_DICT, dict)
+
+    # Test that all values are tuples, their layout is checked through COLORS_ARRAY below
+    assert all(type(color_value) is tuple for color_value in COLORS_DICT.values())
 
-    # Test that all values are RGBA tuples
-    for color_value in COLORS_DICT.values():
-        assert isinstance(color_value, tuple)
-        assert len(color_value) == 4
-        for component in color_value:
-            assert isinstance(component, int)
-            assert 0 <= component <= 255
+    # One uint8 RGBA row per color, uint8 keeps every component within 0..255
+    assert COLORS_ARRAY.shape == (len(COLORS_DICT), 4)
+    assert COLORS_ARRAY.dtype == np.uint8
+    assert COLORS_ARRAY.tolist() == [list(color_value) for color_value in COLORS_DICT.values()]
 
 
 def test_common_colors_present():
@@ -29,3 +35,14 @@ def test_color_values():
     assert COLORS_DICT["yellow"] == (255, 255, 0, 255)
     assert COLORS_DICT["cyan"] == (0, 255, 255, 255)
     assert COLORS_DICT["magenta"] == (255, 0, 255, 255)
+
+
+def test_lookup_color():
+    assert tuple(lookup_color("yellow")) == COLORS_DICT["yellow"]
+    assert list(COLOR_NAMES) == list(COLORS_DICT)
+    # rows are views into the shared read-only table
+    assert lookup_color("white").base is COLORS_ARRAY
+    with pytest.raises(ValueError):
+        lookup_color("white")[0] = 0
+    with pytest.raises(KeyError):
+        lookup_color("black")
@@ -54,7 +54,8 @@ def test_download_with_chapters(mock_music_dir, mock_ydl_with_chapters):
 
         assert isinstance(result, list)
         assert len(result) >= 0  # Since files are only checked at end
-        mock_ydl_with_chapters.download.call_count == 2
+        chapters = mock_ydl_with_chapters.sanitize_info.return_value["chapters"]
+        assert mock_ydl_with_chapters.download.call_count == len(chapters)
 
 
 def test_download_with_existing_files(mock_music_dir, mock_ydl_no_chapters):
@@ -1,9 +1,12 @@
+import textwrap
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from ShortsMaker.utils.get_tts import (
     ENDPOINT_DATA,
+    REQUEST_TIMEOUT,
     VOICES,
     _process_chunks,
     _split_text,
@@ -40,23 +43,31 @@ def test_split_text():
     assert all(len(chunk) <= 20 for chunk in chunks)
 
 
-@patch("requests.post")
+def test_split_text_long_text_matches_textwrap():
+    words = ["short", "a", "mother-in-law", "x" * 300, "extraordinary"] * 100
+    text = " ".join(words)
+    chunks = _split_text(text)
+    assert chunks == textwrap.wrap(text, width=250, break_long_words=False, break_on_hyphens=False)
+    assert " ".join(chunks).split() == words
+
+
+@patch("ShortsMaker.utils.get_tts._SESSION.post")
 def test_process_chunks_success(mock_post):
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "fake_base64_data"}
+    mock_response.json.return_value = {"data": "ZmFrZV9hdWRpbw=="}
     mock_post.return_value = mock_response
 
     chunks = ["test chunk"]
     endpoint = {"url": "test_url", "response": "data"}
     voice = VOICES[0]
-    audio_data = [""]
+    audio_data = [b""]
 
     result = _process_chunks(chunks, endpoint, voice, audio_data)
-    assert result == ["fake_base64_data"]
+    assert result == [b"fake_audio"]
 
 
-@patch("requests.post")
+@patch("ShortsMaker.utils.get_tts._SESSION.post")
 def test_process_chunks_failure(mock_post):
     mock_response = Mock()
     mock_response.status_code = 404
@@ -65,14 +76,27 @@ def test_process_chunks_failure(mock_post):
     chunks = ["test chunk"]
     endpoint = {"url": "test_url", "response": "data"}
     voice = VOICES[0]
-    audio_data = [""]
+    audio_data = [b""]
 
     result = _process_chunks(chunks, endpoint, voice, audio_data)
     assert result is None
 
 
+@patch("ShortsMaker.utils.get_tts._SESSION.post")
+def test_process_chunks_invalid_base64(mock_post):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"data": "not base64"}
+    mock_post.return_value = mock_response
+
+    result = _process_chunks(
+        ["test chunk"], {"url": "test_url", "response": "data"}, VOICES[0], [b""]
+    )
+    assert result is None
+
+
 @patch("pydub.AudioSegment.from_file")
-@patch("requests.post")
+@patch("ShortsMaker.utils.get_tts._SESSION.post")
 def test_tts_integration(mock_post, mock_audio):
     mock_response = Mock()
     mock_response.status_code = 200
@@ -87,11 +111,11 @@ def test_tts_integration(mock_post, mock_audio):
     assert mock_audio_obj.export.called
 
 
-@patch("requests.post")
+@patch("ShortsMaker.utils.get_tts._SESSION.post")
 @patch("ShortsMaker.utils.get_tts._save_audio")
 def test_tts_with_failing_and_successful_endpoints(mock_save_audio, mock_post):
     # Mock responses for endpoints
-    def mock_post_side_effect(url, json, headers) -> Mock:
+    def mock_post_side_effect(url, json, headers, timeout) -> Mock:
         if url == ENDPOINT_DATA[0]["url"]:
             # Simulate failure for the first endpoint
             response = Mock()
@@ -101,7 +125,7 @@ def test_tts_with_failing_and_successful_endpoints(mock_save_audio, mock_post):
             # Simulate success for the second endpoint
             response = Mock()
             response.status_code = 200
-            response.json.return_value = {ENDPOINT_DATA[1]["response"]: "mock_audio_data"}
+            response.json.return_value = {ENDPOINT_DATA[1]["response"]: "bW9ja19hdWRpbw=="}
             return response
 
     mock_post.side_effect = mock_post_side_effect
@@ -124,6 +148,7 @@ def test_tts_with_failing_and_successful_endpoints(mock_save_audio, mock_post):
         headers={
             "User-Agent": "com.zhiliaoapp.musically/2022600030 (Linux; U; Android 7.1.2; es_ES; SM-G988N; Build/NRD90M;tt-ok/3.12.13.1)",
         },
+        timeout=REQUEST_TIMEOUT,
     )
     mock_post.assert_any_call(
         ENDPOINT_DATA[1]["url"],
@@ -131,5 +156,42 @@ def test_tts_with_failing_and_successful_endpoints(mock_save_audio, mock_post):
         headers={
             "User-Agent": "com.zhiliaoapp.musically/2022600030 (Linux; U; Android 7.1.2; es_ES; SM-G988N; Build/NRD90M;tt-ok/3.12.13.1)",
         },
+        timeout=REQUEST_TIMEOUT,
     )
-    mock_save_audio.assert_called_once_with(["mock_audio_data"], output_filename)
+    mock_save_audio.assert_called_once_with([b"mock_audio"], output_filename)
+
+
+@patch("ShortsMaker.utils.get_tts._SESSION.post")
+@patch("ShortsMaker.utils.get_tts._save_audio")
+def test_tts_falls_back_when_endpoint_times_out(mock_save_audio, mock_post):
+    response = Mock(status_code=200)
+    response.json.return_value = {ENDPOINT_DATA[1]["response"]: "bW9ja19hdWRpbw=="}
+    mock_post.side_effect = [requests.exceptions.ReadTimeout("too slow"), response]
+
+    tts("This is a test.", VOICES[0], "test_output.mp3")
+
+    assert mock_post.call_count == 2
+    assert mock_post.call_args.args[0] == ENDPOINT_DATA[1]["url"]
+    mock_save_audio.assert_called_once_with([b"mock_audio"], "test_output.mp3")
+
+
+@pytest.mark.parametrize(
+    "bad_body",
+    [{"unexpected_key": "bW9ja19hdWRpbw=="}, ["bW9ja19hdWRpbw=="]],
+    ids=["missing_key", "not_an_object"],
+)
+@patch("ShortsMaker.utils.get_tts._SESSION.post")
+@patch("ShortsMaker.utils.get_tts._save_audio")
+def test_tts_falls_back_on_unexpected_response_body(mock_save_audio, mock_post, bad_body):
+    bad_response = Mock(status_code=200)
+    bad_response.json.return_value = bad_body
+    good_response = Mock(status_code=200)
+    good_response.json.return_value = {ENDPOINT_DATA[1]["response"]: "bW9ja19hdWRpbw=="}
+    mock_post.side_effect = [bad_response, good_response]
+
+    tts("This is a test.", VOICES[0], "test_output.mp3")
+
+    # the next endpoint is used directly, without a retry of the whole tts call
+    assert mock_post.call_count == 2
+    assert mock_post.call_args.args[0] == ENDPOINT_DATA[1]["url"]
+    mock_save_audio.assert_called_once_with([b"mock_audio"], "test_output.mp3")
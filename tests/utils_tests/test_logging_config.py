@@ -6,24 +6,26 @@ import pytest
 import ShortsMaker
 import ShortsMaker.utils
 from ShortsMaker.utils.logging_config import (
-    LOGGERS,
     configure_logging,
     get_logger,
 )
 
 
-@pytest.fixture
-def reset_logging_state():
-    """Reset global logging state between tests"""
-    global INITIALIZED, LOGGERS
-    INITIALIZED = False
-    LOGGERS.clear()
-    yield
-    INITIALIZED = False
-    LOGGERS.clear()
+@pytest.fixture(autouse=True)
+def reset_logging_state(monkeypatch):
+    """Give each test fresh logging globals, monkeypatch restores the real ones afterwards"""
+    module = ShortsMaker.utils.logging_config
+    monkeypatch.setattr(module, "LOGGERS", {})
+    monkeypatch.setattr(module, "INITIALIZED", False)
+    monkeypatch.setattr(module, "LOG_FILE", module.LOG_FILE)
+    monkeypatch.setattr(module, "LOG_LEVEL", module.LOG_LEVEL)
+    monkeypatch.setattr(module, "LOGGING_ENABLED", module.LOGGING_ENABLED)
+    # get_logger only sets the level on loggers without handlers, so a "test_logger" left
+    # configured by another test in the same process must not be handed back here
+    monkeypatch.delitem(logging.Logger.manager.loggerDict, "test_logger", raising=False)
 
 
-def test_get_logger_creates_new_logger(reset_logging_state):
+def test_get_logger_creates_new_logger():
     logger = get_logger("test_logger")
     assert isinstance(logger, logging.Logger)
     assert logger.name == "test_logger"
@@ -31,13 +33,13 @@ def test_get_logger_creates_new_logger(reset_logging_state):
     assert not logger.propagate
 
 
-def test_get_logger_returns_cached_logger(reset_logging_state):
+def test_get_logger_returns_cached_logger():
     logger1 = get_logger("test_logger")
     logger2 = get_logger("test_logger")
     assert logger1 is logger2
 
 
-def test_configure_logging_updates_settings(reset_logging_state, tmp_path):
+def test_configure_logging_updates_settings(tmp_path):
     test_log_file = tmp_path / "test.log"
     test_level = "INFO"
     configure_logging(log_file=test_log_file, level=test_level, enable=True)
@@ -47,7 +49,7 @@ def test_configure_logging_updates_settings(reset_logging_state, tmp_path):
     assert ShortsMaker.utils.logging_config.INITIALIZED is True
 
 
-def test_configure_logging_updates_existing_loggers(reset_logging_state):
+def test_configure_logging_updates_existing_loggers():
     logger = get_logger("test_logger")
 
     configure_logging(level="INFO", enable=True)
@@ -63,7 +65,7 @@ def test_configure_logging_creates_directory(mock_mkdir):
     mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
 
-def test_disabled_logging_sets_critical_level(reset_logging_state):
+def test_disabled_logging_sets_critical_level():
     configure_logging(enable=False)
     logger = get_logger("test_logger")
     assert logger.level == logging.CRITICAL
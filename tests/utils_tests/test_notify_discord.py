@@ -1,56 +1,91 @@
+import importlib
 import os
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests_mock
 from requests import Response
 
 from ShortsMaker.utils.notify_discord import get_arthas, get_meme, notify_discord
 
+# ShortsMaker.utils re-exports the notify_discord function under the module's name
+notify_discord_module = importlib.import_module("ShortsMaker.utils.notify_discord")
+
+# Attribute names of a real Response, instance ones like status_code included, computed once
+_RESPONSE_SPEC = [name for name in dir(Response()) if not name.startswith("_")]
+
+# Minimal Bing image search result, get_arthas pulls the murl out of it
+_BING_HTML = """
+    <div class="imgpt"><a m='{"murl":"test_image.jpg"}'>Test</a></div>
+"""
+
+_FAKE_MEME_URL = "http://fake-meme.com/image.jpg"
+_FAKE_ARTHAS_URL = "http://fake-arthas.com/image.jpg"
+
+# Message longer than the 4000 char embed limit, forces notify_discord to split it
+_LONG_MSG = "x" * 5000
+
 
 @pytest.fixture
 def mock_response():
-    response = MagicMock(spec=Response)
+    response = MagicMock(spec_set=_RESPONSE_SPEC)
     response.status_code = 200
     response.text = "Success"
     return response
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_webhook():
-    with patch("ShortsMaker.utils.notify_discord.DiscordWebhook") as mock:
-        webhook = MagicMock()
-        webhook.execute.return_value = MagicMock(spec=Response)
-        mock.return_value = webhook
+    with patch.object(notify_discord_module, "DiscordWebhook") as mock:
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_get_meme():
-    with patch("ShortsMaker.utils.notify_discord.get_meme") as mock:
-        mock.return_value = "http://fake-meme.com/image.jpg"
+    with patch.object(notify_discord_module, "get_meme") as mock:
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_get_arthas():
-    with patch("ShortsMaker.utils.notify_discord.get_arthas") as mock:
-        mock.return_value = "http://fake-arthas.com/image.jpg"
+    with patch.object(notify_discord_module, "get_arthas") as mock:
         yield mock
 
 
-def test_get_arthas(requests_mock):
-    mock_html = """
-        <div class="imgpt"><a m='{"murl":"test_image.jpg"}'>Test</a></div>
+@pytest.fixture(autouse=True)
+def reset_discord_mocks(mock_webhook, mock_get_meme, mock_get_arthas):
+    """The patches above live for the whole module, put them back in a known state per test.
+
+    Tests that check get_meme/get_arthas call the functions imported at the top of this
+    module, which are the originals and not affected by the patches.
     """
-    requests_mock.get("https://www.bing.com/images/search", text=mock_html)
+    for mock in (mock_webhook, mock_get_meme, mock_get_arthas):
+        mock.reset_mock(return_value=True, side_effect=True)
+    # A new mock per test, copies of one mock would share their child mocks (json, ...)
+    mock_webhook.return_value.execute.return_value = MagicMock(spec_set=_RESPONSE_SPEC)
+    mock_get_meme.return_value = _FAKE_MEME_URL
+    mock_get_arthas.return_value = _FAKE_ARTHAS_URL
+
+
+@pytest.fixture(scope="module")
+def mocked_http():
+    """Serves the Bing and meme API endpoints for the whole module from one mocker."""
+    with requests_mock.Mocker() as mocker:
+        mocker.get("https://www.bing.com/images/search", text=_BING_HTML)
+        mocker.get(
+            "https://memeapi.zachl.tech/pic/json",
+            json={"MemeURL": "http://test-meme.com/image.jpg"},
+        )
+        yield mocker
+
+
+def test_get_arthas(mocked_http):
     result = get_arthas()
     assert isinstance(result, str)
     assert result == "test_image.jpg"
 
 
-def test_get_meme(requests_mock):
-    mock_response = {"MemeURL": "http://test-meme.com/image.jpg"}
-    requests_mock.get("https://memeapi.zachl.tech/pic/json", json=mock_response)
+def test_get_meme(mocked_http):
     result = get_meme()
     assert result == "http://test-meme.com/image.jpg"
 
@@ -64,31 +99,36 @@ def test_notify_discord_short_message(mock_webhook):
     assert result is not None
 
 
+@pytest.mark.slow
 def test_notify_discord_long_message(mock_webhook, mock_get_meme, mock_get_arthas, mock_response):
     os.environ["DISCORD_WEBHOOK_URL"] = "https://discord.com/api/webhooks/xxxxxx"
-    message = "x" * 5000  # Message longer than 4000 chars
     mock_webhook.return_value.execute.return_value = MagicMock(status_code=200)
-    result = notify_discord(message)
+    result = notify_discord(_LONG_MSG)
     assert mock_webhook.call_count > 1
     assert result is not None
 
 
+@pytest.fixture
+def response_tuple(request):
+    """The (status_code, text) pair a parametrized test wants the webhook to answer with."""
+    return request.param
+
+
 @pytest.mark.parametrize(
-    "status_code,expected_text",
+    "response_tuple",
     [
         (200, "Success"),
         (400, "Bad Request"),
     ],
+    indirect=True,
 )
-def test_notify_discord_response(
-    mock_webhook, mock_get_meme, mock_get_arthas, status_code, expected_text
-):
+def test_notify_discord_response(mock_webhook, response_tuple):
     os.environ["DISCORD_WEBHOOK_URL"] = "https://discord.com/api/webhooks/xxxxxx"
-    webhook = mock_webhook.return_value
-    response = MagicMock(spec=Response)
+    status_code, expected_text = response_tuple
+    # reset_discord_mocks already installed a fresh Response copy, only its fields vary
+    response = mock_webhook.return_value.execute.return_value
     response.status_code = status_code
     response.text = expected_text
-    webhook.execute.return_value = response
 
     result = notify_discord("Test message")
     assert result.status_code == status_code
@@ -1,131 +1,140 @@
-from unittest.mock import Mock, patch
+import importlib
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 
 from ShortsMaker.utils.retry import retry
 
+# ShortsMaker.utils re-exports the retry function under the module's name
+retry_module = importlib.import_module("ShortsMaker.utils.retry")
 
-def test_retry_preserves_function_docstring():
-    @retry(max_retries=3, delay=0)
-    def mock_func():
-        """This is a test function."""
-        pass
 
-    assert mock_func.__doc__ == "This is a test function."
+@pytest.fixture(autouse=True)
+def mock_sleep():
+    """Makes every retry wait return immediately, whatever delay a test passes."""
+    with patch.object(retry_module.time, "sleep") as mock:
+        yield mock
 
 
-@patch("ShortsMaker.utils.retry.logger")
-def test_retry_logs_function_name(mock_logger):
-    # Test that function name is correctly logged
-    mock_func = Mock(return_value="success")
-    mock_func.__name__ = "test_func"
-    decorated = retry(max_retries=1, delay=0)(mock_func)
+@pytest.fixture(autouse=True)
+def mock_logger(monkeypatch):
+    """A fresh logger mock per test so positional call_args_list lookups stay short.
 
-    decorated()
+    Autouse so no test writes to the real log, tests that assert on it request it by name.
+    """
+    logger = MagicMock()
+    monkeypatch.setattr(retry_module, "logger", logger)
+    return logger
 
-    mock_logger.info.assert_any_call("Begin function test_func")
 
+@pytest.fixture
+def make_flaky():
+    """Builds a named Mock that raises or returns following the given side effect."""
 
-@patch("ShortsMaker.utils.retry.logger")
-def test_retry_logs_return_value(mock_logger):
-    # Test that return value is correctly logged
-    mock_func = Mock(return_value="test_value")
-    mock_func.__name__ = "test_func"
-    decorated = retry(max_retries=1, delay=0)(mock_func)
+    def _make_flaky(pattern, name="test_func"):
+        mock_func = Mock(side_effect=pattern)
+        mock_func.__name__ = name
+        return mock_func
 
-    decorated()
-
-    mock_logger.info.assert_any_call("Returned: test_value")
+    return _make_flaky
 
 
-@patch("ShortsMaker.utils.retry.logger")
-def test_retry_logs_execution_time(mock_logger):
-    # Test that execution time is logged
+@pytest.fixture
+def decorated_noop():
+    """A retry-wrapped Mock that always succeeds, the Mock itself is at __wrapped__."""
     mock_func = Mock(return_value="success")
     mock_func.__name__ = "test_func"
-    decorated = retry(max_retries=1, delay=0)(mock_func)
+    mock_func.__doc__ = "This is a test function."
+    return retry(max_retries=1, delay=0)(mock_func)
 
-    decorated()
 
-    # Check that completion log contains function name and execution time
-    completion_log_call = mock_logger.info.call_args_list[-1]
-    assert "Completed function test_func in" in str(completion_log_call)
-    assert "s after 1 max_retries" in str(completion_log_call)
+@pytest.fixture
+def decorated_success(decorated_noop, mock_logger):
+    """Runs one successful decorated call and returns the logger it wrote to."""
+    decorated_noop()
+    return mock_logger
 
 
-@patch("ShortsMaker.utils.retry.logger")
-def test_retry_logs_max_retries_and_delay(mock_logger):
-    # Test that retry parameters are logged
-    mock_func = Mock(return_value="success")
-    mock_func.__name__ = "test_func"
-    decorated = retry(max_retries=5, delay=10)(mock_func)
+def test_retry_preserves_function_docstring(decorated_noop):
+    assert decorated_noop.__doc__ == "This is a test function."
 
-    decorated()
 
-    mock_logger.info.assert_any_call("Using retry decorator with 5 max_retries and 10s delay")
+def test_retry_logs_successful_call(decorated_success):
+    info_calls = [c.args[0] for c in decorated_success.info.call_args_list]
 
+    assert info_calls[:3] == [
+        "Using retry decorator with 1 max_retries and 0s delay",
+        "Begin function test_func",
+        "Returned: success",
+    ]
+    # Completion log is the last one and contains function name and execution time
+    msg = decorated_success.info.call_args.args[0]
+    assert "Completed function test_func in" in msg and "s after 1 max_retries" in msg
 
-@patch("ShortsMaker.utils.retry.logger")
-def test_retry_logs_attempts(mock_logger):
-    mock_func = Mock(side_effect=[Exception("error"), "success"])
-    mock_func.__name__ = "test_func"
+
+def test_retry_logs_attempts(mock_logger, make_flaky):
+    mock_func = make_flaky([Exception("error"), "success"])
     decorated = retry(max_retries=2, delay=0)(mock_func)
 
     decorated()
 
-    assert mock_logger.info.call_count >= 2
-    assert mock_logger.warning.call_count == 1
+    assert mock_logger.info.call_count == 4
+    assert mock_logger.info.call_args_list[1].args[0] == "Begin function test_func"
+    assert mock_logger.info.call_args_list[2].args[0] == "Returned: success"
     assert mock_logger.exception.call_count == 1
-
-
-def test_retry_successful_second_attempt():
-    mock_func = Mock(side_effect=[Exception("error"), "success"])
-    mock_func.__name__ = "test_func"
-    decorated = retry(max_retries=3, delay=0)(mock_func)
-
-    result = decorated()
-
-    assert result == "success"
-    assert mock_func.call_count == 2
-
-
-def test_retry_all_attempts_failed():
-    mock_func = Mock(side_effect=Exception("error"))
-    mock_func.__name__ = "test_func"
-    decorated = retry(max_retries=3, delay=0)(mock_func)
+    assert mock_logger.exception.call_args.args[0] == "Exception: error"
+    assert mock_logger.warning.call_count == 1
+    assert mock_logger.warning.call_args.args[0] == "Retrying function test_func after 0s"
+
+
+@pytest.mark.parametrize(
+    "side_effect,max_retries,expected,calls,notify",
+    [
+        ([Exception("error"), "success"], 3, "success", 2, False),
+        (Exception("error"), 3, None, 3, False),
+        (Exception("error"), 2, None, 2, True),
+    ],
+    ids=["successful_second_attempt", "all_attempts_failed", "with_notify"],
+)
+@patch.object(retry_module, "notify_discord")
+def test_retry_paths(mock_notify, make_flaky, side_effect, max_retries, expected, calls, notify):
+    mock_func = make_flaky(side_effect)
+    decorated = retry(max_retries=max_retries, delay=0, notify=notify)(mock_func)
 
     result = decorated()
 
-    assert result is None
-    assert mock_func.call_count == 3
+    assert result == expected
+    assert mock_func.call_count == calls
+    if notify:
+        mock_notify.assert_called_once_with(
+            f"test_func Failed after {max_retries} max_retries.\nException: error"
+        )
+    else:
+        mock_notify.assert_not_called()
 
 
-@patch("ShortsMaker.utils.retry.notify_discord")
-def test_retry_with_notify(mock_notify):
-    mock_func = Mock(side_effect=Exception("error"))
-    mock_func.__name__ = "test_func"
-    decorated = retry(max_retries=2, delay=0, notify=True)(mock_func)
+def test_retry_respects_delay(mock_sleep, make_flaky):
+    mock_func = make_flaky([Exception("error"), "success"])
+    delay = 5
+    decorated = retry(max_retries=3, delay=delay)(mock_func)
 
     decorated()
 
-    mock_notify.assert_called_once_with("test_func Failed after 2 max_retries.\nException: error")
+    mock_sleep.assert_called_once_with(delay)
 
 
-@patch("time.sleep")
-def test_retry_respects_delay(mock_sleep):
-    mock_func = Mock(side_effect=[Exception("error"), "success"])
-    mock_func.__name__ = "test_func"
-    delay = 5
-    decorated = retry(max_retries=3, delay=delay)(mock_func)
+@patch.object(retry_module.random, "uniform", return_value=1.0)
+def test_retry_exponential_backoff(mock_uniform, mock_sleep, make_flaky):
+    mock_func = make_flaky(Exception("error"))
+    decorated = retry(max_retries=4, delay=1, max_delay=5, backoff=2.0, jitter=0.5)(mock_func)
 
     decorated()
 
-    mock_sleep.assert_called_once_with(delay)
-
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2, 4, 5]
+    mock_uniform.assert_called_with(0.5, 1.5)
 
-def test_retry_preserves_function_args():
-    mock_func = Mock(return_value="success")
-    mock_func.__name__ = "test_func"
-    decorated = retry(max_retries=3, delay=0)(mock_func)
 
-    decorated(1, key="value")
+def test_retry_preserves_function_args(decorated_noop):
+    decorated_noop(1, key="value")
 
-    mock_func.assert_called_once_with(1, key="value")
+    decorated_noop.__wrapped__.assert_called_once_with(1, key="value")